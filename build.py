@@ -4,6 +4,7 @@
 """
 打包脚本 - 用于将应用程序打包为Windows可执行文件
 使用方法：在Windows环境中运行 python build.py
+默认复用 build/ 中的分析缓存，需要完全重新构建时使用 python build.py --full-rebuild
 """
 
 import os
@@ -13,6 +14,7 @@ import shutil
 
 APP_NAME = "草稿箱管理系统"
 APP_VERSION = "1.0.0"
+SPEC_FILE = "pyinstaller_spec.spec"
 
 def clean_build_dirs():
     """清理构建目录"""
@@ -22,32 +24,32 @@ def clean_build_dirs():
             print(f"清理目录: {dir_name}")
             shutil.rmtree(dir_name)
 
-def build_app():
-    """构建应用程序"""
+def build_app(full_rebuild=False):
+    """
+    构建应用程序
+    
+    Args:
+        full_rebuild (bool): 是否清理PyInstaller缓存后完全重新构建
+    """
     print("开始构建应用程序...")
     
-    # PyInstaller命令和参数
+    # PyInstaller命令和参数，打包选项见spec文件
     pyinstaller_cmd = [
         "pyinstaller",
-        "--name", APP_NAME,
-        "--windowed",  # 无控制台窗口
-        "--icon=assets/icon.ico",  # 应用图标，请确保此路径存在
-        "--add-data", "assets;assets",  # 添加资源文件
-        "--hidden-import", "PyQt6.QtSvg",  # 添加隐式导入
-        "--hidden-import", "PyQt6.QtXml",
         "--log-level", "INFO",
-        "--clean",  # 每次构建前清理
         "--noconfirm",  # 不提示确认
-        "main.py"  # 主程序入口
     ]
     
-    # 执行PyInstaller命令
-    result = subprocess.run(pyinstaller_cmd, capture_output=True, text=True)
+    if full_rebuild:
+        pyinstaller_cmd.append("--clean")  # 清理缓存后构建
+        
+    pyinstaller_cmd.append(SPEC_FILE)
+    
+    # 执行PyInstaller命令，输出直接打印到控制台以便实时查看进度
+    result = subprocess.run(pyinstaller_cmd, check=False)
     
     if result.returncode != 0:
-        print("构建失败!")
-        print("错误信息:")
-        print(result.stderr)
+        print("构建失败! 错误信息见上方PyInstaller输出")
         return False
     
     print("构建成功!")
@@ -68,11 +70,14 @@ def main():
         if response.lower() != 'y':
             return
     
-    # 清理构建目录
-    clean_build_dirs()
+    full_rebuild = "--full-rebuild" in sys.argv[1:]
+    
+    # 仅在完全重新构建时清理构建目录，否则复用分析缓存
+    if full_rebuild:
+        clean_build_dirs()
     
     # 构建应用程序
-    if build_app():
+    if build_app(full_rebuild):
         # 可选: 创建安装程序
         create_installer_choice = input("是否创建安装程序? (y/n): ")
         if create_installer_choice.lower() == 'y':
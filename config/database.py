@@ -2,10 +2,46 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
 import mysql.connector
-from mysql.connector import pooling
+from mysql.connector import pooling, errorcode
 import logging
-from config.settings import get_setting
+from collections import OrderedDict
+from contextlib import contextmanager, closing
+from concurrent.futures import ThreadPoolExecutor
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Matches "INSERT ... VALUES (%s, ...)" so batches can be sent as one multi-row INSERT;
+# the row may also contain SQL expressions such as NOW() or COALESCE(%s, NOW())
+_INSERT_VALUES_RE = re.compile(
+    r"^\s*(INSERT\s(?:(?!VALUES).)+?\sVALUES)\s*(\((?:[^()]|\((?:[^()]|\([^()]*\))*\))*\))(.*)$",
+    re.IGNORECASE | re.DOTALL
+)
+
+# db_config keys that configure the pool rather than individual connections
+_POOL_OPTIONS = ('pool_size', 'pool_reset_session')
+
+# Maximum number of rows per multi-row INSERT statement
+BATCH_SIZE = 500
+
+# Maximum number of prepared statements kept open per connection
+PREPARED_CACHE_SIZE = 32
+
+def _chunk(items, size):
+    """
+    Split a list into consecutive chunks
+    
+    Args:
+        items (list): Items to split
+        size (int): Maximum chunk size
+        
+    Yields:
+        list: Consecutive slices of items
+    """
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
 
 class DatabasePool:
     """Database connection pool manager"""
@@ -25,31 +61,77 @@ class DatabasePool:
             return
             
         self._initialized = True
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         
         # Get database configuration from environment variables
+        settings = get_settings()
         self.db_config = {
-            'host': get_setting('DB_HOST', 'localhost'),
-            'port': int(get_setting('DB_PORT', 3306)),
-            'user': get_setting('DB_USER', 'root'),
-            'password': get_setting('DB_PASSWORD', ''),
-            'database': get_setting('DB_NAME', 'draft_box'),
-            'use_pure': True,
+            'host': settings.db_host,
+            'port': settings.db_port,
+            'user': settings.db_user,
+            'password': settings.db_password,
+            'database': settings.db_name,
+            # Prefer the C extension's faster row decoding unless told otherwise
+            'use_pure': settings.db_use_pure or not mysql.connector.HAVE_CEXT,
             'autocommit': True,
-            'pool_size': 5
+            # Report matched rather than changed rows, so an UPDATE that
+            # finds its row but changes nothing still counts it
+            'client_flags': [mysql.connector.ClientFlag.FOUND_ROWS],
+            'pool_size': min(settings.db_pool_size, pooling.CNX_POOL_MAXSIZE),
+            # Skip COM_RESET_CONNECTION on every checkout
+            'pool_reset_session': False
         }
         
         try:
             # Create connection pool
             self.pool = mysql.connector.pooling.MySQLConnectionPool(
                 pool_name="draft_box_pool",
-                **self.db_config
+                pool_size=self.db_config['pool_size'],
+                pool_reset_session=self.db_config['pool_reset_session']
             )
+            self.pool.set_config(**self._connection_config())
+            self._eagerly_fill_pool()
             self.logger.info("Database connection pool initialized")
         except mysql.connector.Error as err:
             self.logger.error("Failed to create database connection pool: %s", err)
             self.pool = None
     
+    def _connection_config(self):
+        """
+        Get the per-connection part of db_config
+        
+        Returns:
+            dict: Connection arguments without pool options
+        """
+        return {key: value for key, value in self.db_config.items() if key not in _POOL_OPTIONS}
+        
+    def _eagerly_fill_pool(self):
+        """
+        Open all pooled connections up front, in parallel, so the first
+        queries don't pay the TCP and authentication handshake
+        
+        Raises:
+            mysql.connector.Error: If a connection cannot be established
+        """
+        config = self._connection_config()
+        pool_size = self.db_config['pool_size']
+        
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            futures = [executor.submit(mysql.connector.connect, **config) for _ in range(pool_size)]
+            
+        connections = [future.result() for future in futures if not future.exception()]
+        if len(connections) < pool_size:
+            # Don't leave the connections that did open dangling
+            for connection in connections:
+                connection.close()
+            raise next(future.exception() for future in futures if future.exception())
+            
+        # Tag connections the way the pool does, otherwise they are reconnected on first checkout
+        config_version = getattr(self.pool, '_config_version', None)
+        for connection in connections:
+            connection.pool_config_version = config_version
+            self.pool.add_connection(connection)
+    
     def get_connection(self):
         """
         Get a connection from the pool
@@ -71,6 +153,23 @@ class DatabasePool:
             self.logger.error("Failed to get connection from pool: %s", err)
             raise
     
+    @contextmanager
+    def connection(self):
+        """
+        Borrow a connection from the pool and return it when done
+        
+        Yields:
+            mysql.connector.connection.MySQLConnection: Database connection
+            
+        Raises:
+            mysql.connector.Error: If connection cannot be established
+        """
+        connection = self.get_connection()
+        try:
+            yield connection
+        finally:
+            connection.close()
+    
     def execute_query(self, query, params=None, fetch=True):
         """
         Execute a SQL query and return the results
@@ -86,53 +185,161 @@ class DatabasePool:
         Raises:
             mysql.connector.Error: If query execution fails
         """
-        connection = None
-        cursor = None
         try:
-            connection = self.get_connection()
-            cursor = connection.cursor(dictionary=True)
-            cursor.execute(query, params)
+            with self.connection() as connection, closing(connection.cursor()) as cursor:
+                cursor.execute(query, params)
+                
+                if fetch:
+                    # Resolve column names once per statement instead of per row
+                    columns = cursor.column_names
+                    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+                return None
+        except mysql.connector.Error as err:
+            self.logger.error("Failed to execute query: %s", err)
+            raise
             
-            if fetch:
-                return cursor.fetchall()
-            return None
+    def execute_prepared(self, query, params=None, fetch=True, as_dict=True):
+        """
+        Execute a SQL query as a server-side prepared statement
+        
+        The statement is prepared once per pooled connection and its cursor
+        is kept for later calls with the same query, so repeated statements
+        only send the parameters.
+        
+        Args:
+            query (str): SQL query to execute
+            params (tuple, optional): Parameters for the query
+            fetch (bool, optional): Whether to fetch results
+            as_dict (bool, optional): Return rows as dicts keyed by column
+                name instead of plain tuples
+            
+        Returns:
+            list | int: Query results if fetch is True, else the number of affected rows
+            
+        Raises:
+            mysql.connector.Error: If query execution fails
+        """
+        try:
+            with self.connection() as connection:
+                # Cache on the underlying connection, which outlives the pooled wrapper
+                cnx = getattr(connection, '_cnx', connection)
+                cursors = getattr(cnx, 'prepared_cursors', None)
+                if cursors is None:
+                    cursors = cnx.prepared_cursors = OrderedDict()
+                    
+                cursor = cursors.pop(query, None)
+                cached = cursor is not None
+                if not cached:
+                    cursor = connection.cursor(prepared=True)
+                    
+                try:
+                    try:
+                        cursor.execute(query, params)
+                    except mysql.connector.Error as err:
+                        if not cached or err.errno != errorcode.ER_UNKNOWN_STMT_HANDLER:
+                            raise
+                        # The connection was re-established since the statement was
+                        # prepared, so none of the cached handles exist any more
+                        self.logger.debug("Re-preparing statements after reconnect")
+                        cursors.clear()
+                        cursor = connection.cursor(prepared=True)
+                        cursor.execute(query, params)
+                        
+                    if fetch and as_dict:
+                        columns = cursor.column_names
+                        result = [dict(zip(columns, row)) for row in cursor.fetchall()]
+                    elif fetch:
+                        result = cursor.fetchall()
+                    else:
+                        result = cursor.rowcount
+                except mysql.connector.Error:
+                    # Don't keep a statement that may no longer be valid
+                    cursor.close()
+                    raise
+                    
+                # Most recently used statements live at the end
+                cursors[query] = cursor
+                if len(cursors) > PREPARED_CACHE_SIZE:
+                    cursors.popitem(last=False)[1].close()
+                return result
+        except mysql.connector.Error as err:
+            self.logger.error("Failed to execute prepared query: %s", err)
+            raise
+            
+    def stream_query(self, query, params=None, size=1000):
+        """
+        Execute a SQL query and yield result rows without materializing them all
+        
+        Args:
+            query (str): SQL query to execute
+            params (tuple, optional): Parameters for the query
+            size (int, optional): Number of rows fetched per round-trip
+            
+        Yields:
+            dict: Result row keyed by column name
+            
+        Raises:
+            mysql.connector.Error: If query execution fails
+        """
+        try:
+            with self.connection() as connection, closing(connection.cursor()) as cursor:
+                cursor.execute(query, params)
+                columns = cursor.column_names
+                
+                try:
+                    while True:
+                        rows = cursor.fetchmany(size)
+                        if not rows:
+                            break
+                        for row in rows:
+                            yield dict(zip(columns, row))
+                finally:
+                    # Drain rows left behind if the caller stopped iterating early
+                    connection.consume_results()
         except mysql.connector.Error as err:
             self.logger.error("Failed to execute query: %s", err)
             raise
-        finally:
-            if cursor:
-                cursor.close()
-            if connection:
-                connection.close()
     
-    def execute_many(self, query, params_list):
+    def execute_many(self, query, params_list, batch_size=BATCH_SIZE):
         """
         Execute a SQL query with multiple parameter sets
         
         Args:
             query (str): SQL query to execute
             params_list (list): List of parameter tuples
+            batch_size (int, optional): Maximum rows per multi-row INSERT
             
         Raises:
             mysql.connector.Error: If query execution fails
         """
-        connection = None
-        cursor = None
-        try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            cursor.executemany(query, params_list)
-            connection.commit()
-        except mysql.connector.Error as err:
-            self.logger.error("Failed to execute batch query: %s", err)
-            if connection:
+        with self.connection() as connection:
+            cursor = None
+            try:
+                # Run the whole batch in one transaction; START TRANSACTION
+                # suspends autocommit on the underlying connection until
+                # commit or rollback
+                connection.start_transaction()
+                
+                match = _INSERT_VALUES_RE.match(query)
+                if match:
+                    # Rewrite INSERTs into multi-row statements of batch_size rows each
+                    prefix, row_placeholder, suffix = match.groups()
+                    cursor = connection.cursor()
+                    for chunk in _chunk(list(params_list), batch_size):
+                        batch_query = f"{prefix} {', '.join([row_placeholder] * len(chunk))}{suffix}"
+                        cursor.execute(batch_query, tuple(value for params in chunk for value in params))
+                else:
+                    cursor = connection.cursor(prepared=True)
+                    cursor.executemany(query, params_list)
+                    
+                connection.commit()
+            except mysql.connector.Error as err:
+                self.logger.error("Failed to execute batch query: %s", err)
                 connection.rollback()
-            raise
-        finally:
-            if cursor:
-                cursor.close()
-            if connection:
-                connection.close()
+                raise
+            finally:
+                if cursor:
+                    cursor.close()
                 
     def test_connection(self):
         """
@@ -142,12 +349,9 @@ class DatabasePool:
             bool: True if connection is successful, False otherwise
         """
         try:
-            connection = self.get_connection()
-            cursor = connection.cursor()
-            cursor.execute("SELECT 1")
-            cursor.fetchone()
-            cursor.close()
-            connection.close()
+            # COM_PING avoids allocating a cursor and result set
+            with self.connection() as connection:
+                connection.ping(reconnect=False, attempts=1)
             return True
         except Exception as e:
             self.logger.error("Database connection test failed: %s", e)
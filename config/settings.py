@@ -3,27 +3,241 @@
 
 import os
 import logging
-from dotenv import load_dotenv
+import threading
+import functools
+from dataclasses import dataclass, fields
+from dotenv import dotenv_values
 from pathlib import Path
 
-def load_settings():
+logger = logging.getLogger(__name__)
+
+# Parsed settings, populated once by load_settings()
+_SETTINGS = {}
+_INT_SETTINGS = {}
+_BOOL_SETTINGS = {}
+_loaded = False
+_lock = threading.Lock()
+
+_TRUE_VALUES = ('true', 'yes', '1', 'y', 't')
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Typed snapshot of all application settings, built once by load_settings()
+    
+    Fields have no class-level defaults so the class can use __slots__;
+    defaults live in _SETTING_DEFAULTS.
+    """
+    __slots__ = (
+        'db_host',
+        'db_port',
+        'db_user',
+        'db_password',
+        'db_name',
+        'db_pool_size',
+        'db_use_pure',
+        'api_base_url',
+        'api_timeout',
+        'api_retry_count',
+        'download_concurrent_count',
+        'download_chunk_size',
+        'download_timeout',
+        'sync_interval_seconds',
+        'sync_retry_count',
+        'app_name',
+        'app_version',
+        'log_level',
+        'log_file',
+        'window_width',
+        'window_height',
+        'window_min_width',
+        'window_min_height',
+        'theme',
+        'auto_save_window_state',
+        'show_detailed_errors',
+        'auto_report_errors',
+        'error_log_max_size',
+        'error_log_backup_count',
+        'enable_sound_notifications',
+        'enable_system_tray',
+        'minimize_to_tray',
+        'confirm_exit',
+        'auto_check_updates',
+    )
+    
+    db_host: str
+    db_port: int
+    db_user: str
+    db_password: str
+    db_name: str
+    db_pool_size: int
+    db_use_pure: bool
+    api_base_url: str
+    api_timeout: int
+    api_retry_count: int
+    download_concurrent_count: int
+    download_chunk_size: int
+    download_timeout: int
+    sync_interval_seconds: int
+    sync_retry_count: int
+    app_name: str
+    app_version: str
+    log_level: str
+    log_file: str
+    window_width: int
+    window_height: int
+    window_min_width: int
+    window_min_height: int
+    theme: str
+    auto_save_window_state: bool
+    show_detailed_errors: bool
+    auto_report_errors: bool
+    error_log_max_size: str
+    error_log_backup_count: int
+    enable_sound_notifications: bool
+    enable_system_tray: bool
+    minimize_to_tray: bool
+    confirm_exit: bool
+    auto_check_updates: bool
+
+# Environment key and default value for each Settings field
+_SETTING_DEFAULTS = {
+    'db_host': ('DB_HOST', 'localhost'),
+    'db_port': ('DB_PORT', 3306),
+    'db_user': ('DB_USER', 'root'),
+    'db_password': ('DB_PASSWORD', ''),
+    'db_name': ('DB_NAME', 'draft_box'),
+    'db_pool_size': ('DB_POOL_SIZE', 32),
+    'db_use_pure': ('DB_USE_PURE', False),
+    'api_base_url': ('API_BASE_URL', 'https://api.example.com'),
+    'api_timeout': ('API_TIMEOUT', 30),
+    'api_retry_count': ('API_RETRY_COUNT', 3),
+    'download_concurrent_count': ('DOWNLOAD_CONCURRENT_COUNT', 5),
+    'download_chunk_size': ('DOWNLOAD_CHUNK_SIZE', 262144),
+    'download_timeout': ('DOWNLOAD_TIMEOUT', 300),
+    'sync_interval_seconds': ('SYNC_INTERVAL_SECONDS', 10),
+    'sync_retry_count': ('SYNC_RETRY_COUNT', 3),
+    'app_name': ('APP_NAME', '草稿箱管理系统'),
+    'app_version': ('APP_VERSION', '1.0.0'),
+    'log_level': ('LOG_LEVEL', 'INFO'),
+    'log_file': ('LOG_FILE', 'app.log'),
+    'window_width': ('WINDOW_WIDTH', 1200),
+    'window_height': ('WINDOW_HEIGHT', 800),
+    'window_min_width': ('WINDOW_MIN_WIDTH', 800),
+    'window_min_height': ('WINDOW_MIN_HEIGHT', 600),
+    'theme': ('THEME', 'light'),
+    'auto_save_window_state': ('AUTO_SAVE_WINDOW_STATE', True),
+    'show_detailed_errors': ('SHOW_DETAILED_ERRORS', True),
+    'auto_report_errors': ('AUTO_REPORT_ERRORS', False),
+    'error_log_max_size': ('ERROR_LOG_MAX_SIZE', '10MB'),
+    'error_log_backup_count': ('ERROR_LOG_BACKUP_COUNT', 5),
+    'enable_sound_notifications': ('ENABLE_SOUND_NOTIFICATIONS', True),
+    'enable_system_tray': ('ENABLE_SYSTEM_TRAY', True),
+    'minimize_to_tray': ('MINIMIZE_TO_TRAY', True),
+    'confirm_exit': ('CONFIRM_EXIT', True),
+    'auto_check_updates': ('AUTO_CHECK_UPDATES', False)
+}
+
+# Typed settings snapshot, populated by load_settings()
+SETTINGS = None
+
+def load_settings(force=False):
     """
     Load environment settings from .env file.
     If .env file doesn't exist, create one with default values.
+    
+    The file is parsed once into module-level dicts; process environment
+    variables take precedence over values from the file. Later calls are
+    no-ops unless force is set.
+    
+    Args:
+        force (bool, optional): Re-parse the file even if already loaded
     """
+    global _SETTINGS, _INT_SETTINGS, _BOOL_SETTINGS, _loaded, SETTINGS
+    
+    if _loaded and not force:
+        return
+    
     # Get the root directory of the project
     root_dir = Path(__file__).parent.parent
     env_path = root_dir / '.env'
     
-    # Check if .env file exists
-    if not env_path.exists():
-        create_default_env(env_path)
+    with _lock:
+        # Another thread may have finished loading while we waited
+        if _loaded and not force:
+            return
+            
+        # Open the .env file, creating it with defaults if it doesn't exist
+        try:
+            env_file = open(env_path, 'r', encoding='utf-8')
+        except FileNotFoundError:
+            create_default_env(env_path)
+            env_file = open(env_path, 'r', encoding='utf-8')
+            
+        # Parse .env file and let the process environment override it
+        with env_file:
+            parsed = dotenv_values(stream=env_file)
+        settings = {k: v for k, v in parsed.items() if v is not None}
+        settings.update(os.environ)
         
-    # Load environment variables from .env file
-    load_dotenv(env_path)
+        # Pre-coerce typed values so lookups are plain dict reads
+        int_settings = {}
+        for key, value in settings.items():
+            try:
+                int_settings[key] = int(value)
+            except ValueError:
+                pass
+        bool_settings = {key: value.lower() in _TRUE_VALUES for key, value in settings.items()}
+        
+        _SETTINGS = settings
+        _INT_SETTINGS = int_settings
+        _BOOL_SETTINGS = bool_settings
+        SETTINGS = _build_settings()
+        _loaded = True
+        
+    # Drop memoized typed lookups from any previous load
+    get_int_setting.cache_clear()
+    get_bool_setting.cache_clear()
     
     # Log settings loaded
-    logging.info("Settings loaded from %s", env_path)
+    logger.info("Settings loaded from %s", env_path)
+    
+def _build_settings():
+    """
+    Build the typed Settings snapshot from the parsed values
+    
+    Returns:
+        Settings: Typed settings
+    """
+    values = {}
+    for field in fields(Settings):
+        key, default = _SETTING_DEFAULTS[field.name]
+        if field.type is int:
+            values[field.name] = _INT_SETTINGS.get(key, default)
+        elif field.type is bool:
+            values[field.name] = _BOOL_SETTINGS.get(key, default)
+        else:
+            values[field.name] = _SETTINGS.get(key, default)
+    return Settings(**values)
+    
+def get_settings():
+    """
+    Get the typed settings snapshot, loading settings on first access
+    
+    Returns:
+        Settings: Typed settings
+    """
+    _ensure_loaded()
+    return SETTINGS
+    
+def _ensure_loaded():
+    """Load settings on first access if load_settings() hasn't run yet"""
+    if not _loaded:
+        load_settings()
+        
+def reload_settings():
+    """Re-read the .env file, discarding previously parsed settings"""
+    load_settings(force=True)
     
 def create_default_env(env_path):
     """
@@ -38,6 +252,8 @@ DB_PORT=3306
 DB_USER=root
 DB_PASSWORD=password
 DB_NAME=draft_box
+DB_POOL_SIZE=32
+DB_USE_PURE=false
 
 # API配置
 API_BASE_URL=https://api.example.com
@@ -46,7 +262,7 @@ API_RETRY_COUNT=3
 
 # 下载配置
 DOWNLOAD_CONCURRENT_COUNT=5
-DOWNLOAD_CHUNK_SIZE=8192
+DOWNLOAD_CHUNK_SIZE=262144
 DOWNLOAD_TIMEOUT=300
 
 # 同步配置
@@ -84,7 +300,7 @@ AUTO_CHECK_UPDATES=false
     with open(env_path, 'w', encoding='utf-8') as f:
         f.write(default_env)
     
-    logging.info("Created default .env file at %s", env_path)
+    logger.info("Created default .env file at %s", env_path)
 
 def get_setting(key, default=None):
     """
@@ -97,8 +313,10 @@ def get_setting(key, default=None):
     Returns:
         The value of the environment variable or the default value
     """
-    return os.getenv(key, default)
+    _ensure_loaded()
+    return _SETTINGS.get(key, default)
 
+@functools.lru_cache(maxsize=None)
 def get_int_setting(key, default=0):
     """
     Get an integer setting from environment variables.
@@ -110,11 +328,10 @@ def get_int_setting(key, default=0):
     Returns:
         int: The value of the environment variable as an integer or the default value
     """
-    try:
-        return int(os.getenv(key, default))
-    except (ValueError, TypeError):
-        return default
+    _ensure_loaded()
+    return _INT_SETTINGS.get(key, default)
 
+@functools.lru_cache(maxsize=None)
 def get_bool_setting(key, default=False):
     """
     Get a boolean setting from environment variables.
@@ -126,5 +343,5 @@ def get_bool_setting(key, default=False):
     Returns:
         bool: The value of the environment variable as a boolean or the default value
     """
-    value = os.getenv(key, str(default)).lower()
-    return value in ('true', 'yes', '1', 'y', 't') 
\ No newline at end of file
+    _ensure_loaded()
+    return _BOOL_SETTINGS.get(key, default) 
\ No newline at end of file
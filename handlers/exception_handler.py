@@ -7,7 +7,9 @@ import logging
 from PyQt6.QtCore import QObject, pyqtSignal
 from PyQt6.QtWidgets import QMessageBox
 from qfluentwidgets import MessageBox
-from config.settings import get_bool_setting
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
 
 class ExceptionHandler(QObject):
     """Global exception handler for the application"""
@@ -16,8 +18,8 @@ class ExceptionHandler(QObject):
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.logger = logging.getLogger(__name__)
-        self.show_detailed_errors = get_bool_setting('SHOW_DETAILED_ERRORS', True)
+        self.logger = logger
+        self.show_detailed_errors = get_settings().show_detailed_errors
         
         # Connect signal to show error dialog
         self.exception_raised.connect(self.show_error_dialog)
@@ -42,8 +44,11 @@ class ExceptionHandler(QObject):
             exc_info=(exc_type, exc_value, exc_traceback)
         )
         
-        # Format traceback as string
-        tb_str = ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+        # Only walk the stack when the detailed traceback can be shown
+        if self.show_detailed_errors:
+            tb_str = ''.join(traceback.format_exception(exc_type, exc_value, exc_traceback))
+        else:
+            tb_str = ''.join(traceback.format_exception_only(exc_type, exc_value))
         
         # Get error message
         error_msg = str(exc_value)
@@ -6,18 +6,154 @@ import logging
 from PyQt6.QtCore import QObject, QTimer, pyqtSignal, Qt
 from PyQt6.QtWidgets import QMessageBox, QLabel, QVBoxLayout, QWidget
 from PyQt6.QtGui import QColor, QPalette, QFont
-from config.settings import get_bool_setting
+from config.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Fully formed toast stylesheets per message type
+_STYLES = {
+    'info': """
+        QWidget {
+            border-radius: 6px;
+            padding: 10px;
+        }
+        background-color: #2196F3;
+        color: white;
+    """,
+    'success': """
+        QWidget {
+            border-radius: 6px;
+            padding: 10px;
+        }
+        background-color: #4CAF50;
+        color: white;
+    """,
+    'warning': """
+        QWidget {
+            border-radius: 6px;
+            padding: 10px;
+        }
+        background-color: #FF9800;
+        color: white;
+    """,
+    'error': """
+        QWidget {
+            border-radius: 6px;
+            padding: 10px;
+        }
+        background-color: #F44336;
+        color: white;
+    """
+}
+
+# Font shared by every toast label
+_FONT = QFont()
+_FONT.setPointSize(10)
+
+class ToastNotification(QWidget):
+    """Toast notification widget that appears at the bottom right of the screen"""
+    
+    # Emitted once the toast has been hidden after its display time
+    finished = pyqtSignal()
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        
+        # Set window flags
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint | 
+            Qt.WindowType.Tool |
+            Qt.WindowType.WindowStaysOnTopHint
+        )
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+        
+        # Set up layout
+        layout = QVBoxLayout(self)
+        
+        # Create message label
+        self.label = QLabel()
+        self.label.setWordWrap(True)
+        self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        
+        # Set font
+        self.label.setFont(_FONT)
+        
+        # Add label to layout
+        layout.addWidget(self.label)
+        
+        # Message type whose stylesheet is currently applied
+        self.message_type = None
+        
+        # Set size
+        self.setMinimumWidth(300)
+        self.setMaximumWidth(400)
+        
+        # Set up timer to hide the notification
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self._on_timeout)
+        
+    def show_message(self, message, message_type="info", duration=3000):
+        """
+        Display a message, reusing this widget
+        
+        Args:
+            message (str): Message to display
+            message_type (str): Type of message (info, success, warning, error)
+            duration (int): Duration in milliseconds
+        """
+        self.label.setText(message)
+        self.set_style(message_type)
+        self.adjustSize()
+        self.position_notification()
+        self.timer.start(duration)
+        self.show()
+        
+    def set_style(self, message_type):
+        """Set the style of the notification based on the message type"""
+        if message_type not in _STYLES:
+            message_type = 'info'
+            
+        # Only re-apply (and re-parse) the stylesheet when the type changes
+        if message_type == self.message_type:
+            return
+            
+        self.message_type = message_type
+        self.setStyleSheet(_STYLES[message_type])
+        
+    def position_notification(self):
+        """Position the notification at the bottom right of the screen"""
+        if self.parentWidget():
+            parent_rect = self.parentWidget().geometry()
+            x = parent_rect.width() - self.width() - 20
+            y = parent_rect.height() - self.height() - 20
+            self.move(x, y)
+            
+    def _on_timeout(self):
+        """Hide the notification once its duration has elapsed"""
+        self.hide()
+        self.finished.emit()
 
 class MessageHandler(QObject):
     """Message handler for displaying various types of notifications"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.parent = parent
         self.toast_queue = []
         self.current_toast = None
-        self.enable_sound = get_bool_setting('ENABLE_SOUND_NOTIFICATIONS', True)
+        self.enable_sound = get_settings().enable_sound_notifications
+        self.show_detailed_errors = get_settings().show_detailed_errors
+        
+        # Retry/confirm dialogs, created on first use and reused afterwards
+        self._retry_box = None
+        self._confirm_box = None
+        
+        # Single toast widget reused for every notification
+        self.toast = ToastNotification(self.parent)
+        self.toast.finished.connect(self._show_next_toast)
         
     def show_toast(self, message, message_type="info", duration=3000):
         """
@@ -46,113 +182,11 @@ class MessageHandler(QObject):
         # Get the next toast from the queue
         message, message_type, duration = self.toast_queue.pop(0)
         
-        # 在函数内部创建ToastNotification类的实例
-        class ToastNotification(QWidget):
-            """Toast notification widget that appears at the bottom right of the screen"""
-            
-            def __init__(self, parent=None, message="", message_type="info", duration=3000):
-                super().__init__(parent)
-                
-                # Set window flags
-                self.setWindowFlags(
-                    Qt.WindowType.FramelessWindowHint | 
-                    Qt.WindowType.Tool |
-                    Qt.WindowType.WindowStaysOnTopHint
-                )
-                self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
-                self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
-                
-                # Set up layout
-                layout = QVBoxLayout(self)
-                
-                # Create message label
-                self.label = QLabel(message)
-                self.label.setWordWrap(True)
-                self.label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                
-                # Set font
-                font = QFont()
-                font.setPointSize(10)
-                self.label.setFont(font)
-                
-                # Add label to layout
-                layout.addWidget(self.label)
-                
-                # Set style based on message type
-                self.set_style(message_type)
-                
-                # Set size
-                self.setMinimumWidth(300)
-                self.setMaximumWidth(400)
-                
-                # Set up timer to close the notification
-                self.timer = QTimer(self)
-                self.timer.setSingleShot(True)
-                self.timer.timeout.connect(self.close)
-                self.timer.start(duration)
-                
-                # Position the notification
-                self.position_notification()
-                
-            def set_style(self, message_type):
-                """Set the style of the notification based on the message type"""
-                base_style = """
-                    QWidget {
-                        border-radius: 6px;
-                        padding: 10px;
-                    }
-                """
-                
-                if message_type == "info":
-                    style = base_style + """
-                        background-color: #2196F3;
-                        color: white;
-                    """
-                elif message_type == "success":
-                    style = base_style + """
-                        background-color: #4CAF50;
-                        color: white;
-                    """
-                elif message_type == "warning":
-                    style = base_style + """
-                        background-color: #FF9800;
-                        color: white;
-                    """
-                elif message_type == "error":
-                    style = base_style + """
-                        background-color: #F44336;
-                        color: white;
-                    """
-                else:
-                    style = base_style + """
-                        background-color: #2196F3;
-                        color: white;
-                    """
-                    
-                self.setStyleSheet(style)
-                
-            def position_notification(self):
-                """Position the notification at the bottom right of the screen"""
-                if self.parentWidget():
-                    parent_rect = self.parentWidget().geometry()
-                    x = parent_rect.width() - self.width() - 20
-                    y = parent_rect.height() - self.height() - 20
-                    self.move(x, y)
-        
-        # Create and show the toast
-        toast = ToastNotification(
-            self.parent,
-            message,
-            message_type,
-            duration
-        )
-        toast.show()
+        # Show it on the shared toast widget
+        self.toast.show_message(message, message_type, duration)
         
         # Set as current toast
-        self.current_toast = toast
-        
-        # Connect to the destroyed signal to show the next toast
-        toast.destroyed.connect(self._show_next_toast)
+        self.current_toast = self.toast
         
     def show_info(self, message, duration=3000):
         """
@@ -199,7 +233,7 @@ class MessageHandler(QObject):
         """
         self.show_toast(message, "error", duration)
         
-        if details and get_bool_setting('SHOW_DETAILED_ERRORS', True):
+        if details and self.show_detailed_errors:
             self.show_error_dialog(message, details)
             
         if self.enable_sound:
@@ -235,14 +269,17 @@ class MessageHandler(QObject):
         Returns:
             bool: True if user clicked Retry, False otherwise
         """
-        msg_box = QMessageBox(self.parent)
-        msg_box.setIcon(QMessageBox.Icon.Warning)
+        if self._retry_box is None:
+            self._retry_box = QMessageBox(self.parent)
+            self._retry_box.setIcon(QMessageBox.Icon.Warning)
+            self._retry_box.setStandardButtons(
+                QMessageBox.StandardButton.Retry | 
+                QMessageBox.StandardButton.Cancel
+            )
+            
+        msg_box = self._retry_box
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
-        msg_box.setStandardButtons(
-            QMessageBox.StandardButton.Retry | 
-            QMessageBox.StandardButton.Cancel
-        )
         return msg_box.exec() == QMessageBox.StandardButton.Retry
         
     def show_confirm_dialog(self, title, message, default_button=QMessageBox.StandardButton.No):
@@ -257,14 +294,17 @@ class MessageHandler(QObject):
         Returns:
             bool: True if user clicked Yes, False otherwise
         """
-        msg_box = QMessageBox(self.parent)
-        msg_box.setIcon(QMessageBox.Icon.Question)
+        if self._confirm_box is None:
+            self._confirm_box = QMessageBox(self.parent)
+            self._confirm_box.setIcon(QMessageBox.Icon.Question)
+            self._confirm_box.setStandardButtons(
+                QMessageBox.StandardButton.Yes | 
+                QMessageBox.StandardButton.No
+            )
+            
+        msg_box = self._confirm_box
         msg_box.setWindowTitle(title)
         msg_box.setText(message)
-        msg_box.setStandardButtons(
-            QMessageBox.StandardButton.Yes | 
-            QMessageBox.StandardButton.No
-        )
         msg_box.setDefaultButton(default_button)
         return msg_box.exec() == QMessageBox.StandardButton.Yes
         
@@ -3,20 +3,33 @@
 
 import sys
 import os
-from PyQt6.QtWidgets import QApplication
+import importlib
+from PyQt6.QtWidgets import QApplication, QSplashScreen
 
 # 在所有导入之前创建QApplication实例
 app = QApplication(sys.argv)
 
 # 在这之后导入其他模块
-from PyQt6.QtCore import QTranslator, QLocale
-from PyQt6.QtGui import QFont, QFontDatabase
-from qfluentwidgets import setTheme, Theme
+from PyQt6.QtCore import QSettings
+from PyQt6.QtGui import QFont, QFontDatabase, QPixmap
 
 # 现在可以安全地导入配置和日志模块
 from config.settings import load_settings, get_setting
 from utils.logger import setup_logger
-from handlers.exception_handler import setup_exception_handler
+
+SPLASH_ICON = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', 'icons', 'draft.ico')
+
+def _import_window():
+    """
+    Import the main window class on demand
+    
+    ui.main_window pulls in qfluentwidgets and every panel/service module,
+    so it is only imported once the splash screen is visible.
+    
+    Returns:
+        type: MainWindow class
+    """
+    return importlib.import_module('ui.main_window').MainWindow
 
 def main():
     """Application entry point"""
@@ -27,40 +40,50 @@ def main():
     logger = setup_logger()
     logger.info("Application starting...")
     
+    # 先显示启动画面，再加载较重的界面模块
+    splash = QSplashScreen(QPixmap(SPLASH_ICON))
+    splash.show()
+    app.processEvents()
+    
     # 设置应用程序名称和版本
     app.setApplicationName(get_setting('APP_NAME', '草稿箱管理系统'))
     app.setApplicationVersion(get_setting('APP_VERSION', '1.0.0'))
     
     # 设置应用程序字体
-    # 尝试加载系统中的中文字体
+    # 优先使用上次解析出的字体，避免每次启动都扫描系统字体
     font_families = ["Microsoft YaHei", "WenQuanYi Micro Hei", "SimSun", "Noto Sans CJK SC", "Noto Sans SC"]
     
-    default_font = None
-    available_families = QFontDatabase.families()
-    for family in font_families:
-        font = QFont(family)
-        if font.exactMatch() or family in available_families:
-            default_font = font
-            logger.info(f"使用字体: {family}")
-            break
+    qsettings = QSettings("JianYingPro", "DraftTools")
+    font_family = qsettings.value("CACHED_FONT_FAMILY", "")
+    
+    if not font_family:
+        # 尝试加载系统中的中文字体
+        available_families = set(QFontDatabase.families())
+        font_family = next((family for family in font_families if family in available_families), "")
+        if font_family:
+            qsettings.setValue("CACHED_FONT_FAMILY", font_family)
     
-    if default_font:
-        app.setFont(default_font)
+    if font_family:
+        app.setFont(QFont(font_family))
+        logger.info("使用字体: %s", font_family)
     else:
         logger.warning("找不到合适的中文字体，请安装中文字体包")
     
     # 设置Fluent Design主题
+    from qfluentwidgets import setTheme, Theme
     setTheme(Theme.AUTO)
     
     # 设置异常处理器
+    from handlers.exception_handler import setup_exception_handler
     setup_exception_handler(app)
     
     # 最后再导入MainWindow
-    from ui.main_window import MainWindow
+    MainWindow = _import_window()
     
     # 创建并显示主窗口
     window = MainWindow()
     window.show()
+    splash.finish(window)
     
     # 启动应用程序事件循环
     sys.exit(app.exec())
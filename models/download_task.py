@@ -1,12 +1,52 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+import itertools
+import secrets
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
-import uuid
 
-@dataclass
+from utils.date_utils import parse_iso_datetime
+
+# (field name, default) pairs used by DownloadTask.from_dict; task_id and the
+# datetime fields are resolved separately
+_FROM_DICT_DEFAULTS = (
+    ('draft_uuid', ''),
+    ('file_url', ''),
+    ('local_path', ''),
+    ('file_size', 0),
+    ('downloaded_size', 0),
+    ('status', 'queued'),
+    ('error_message', None),
+    ('retries', 0),
+    ('max_retries', 3)
+)
+
+# Task IDs only need to be unique, so a random per-process prefix plus a
+# counter replaces a uuid4 (and its os.urandom call) per task
+_TASK_ID_PREFIX = secrets.token_hex(8)
+_task_id_counter = itertools.count()
+
+def _new_task_id():
+    """
+    Generate a unique task ID
+    
+    Returns:
+        str: Task ID
+    """
+    return f"{_TASK_ID_PREFIX}-{next(_task_id_counter):012x}"
+
+# Display strings for each status
+_STATUS_DISPLAY = {
+    'queued': '排队中',
+    'downloading': '下载中',
+    'completed': '已完成',
+    'failed': '失败',
+    'paused': '已暂停'
+}
+
+@dataclass(slots=True)
 class DownloadTask:
     """
     Data model for a download task
@@ -38,7 +78,7 @@ class DownloadTask:
         Returns:
             DownloadTask: New download task
         """
-        task_id = str(uuid.uuid4())
+        task_id = _new_task_id()
         return cls(
             task_id=task_id,
             draft_uuid=draft_uuid,
@@ -61,33 +101,27 @@ class DownloadTask:
         Returns:
             DownloadTask: New DownloadTask instance
         """
+        # Fill fields directly, skipping __init__ keyword binding
+        task = cls.__new__(cls)
+        for name, default in _FROM_DICT_DEFAULTS:
+            setattr(task, name, data.get(name, default))
+            
+        task.task_id = data['task_id'] if 'task_id' in data else _new_task_id()
+        
         # Convert string dates to datetime objects
         start_time = data.get('start_time')
         if isinstance(start_time, str):
-            start_time = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+            task.start_time = parse_iso_datetime(start_time)
         else:
-            start_time = datetime.now()
+            task.start_time = datetime.now()
             
         end_time = data.get('end_time')
         if isinstance(end_time, str):
-            end_time = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+            task.end_time = parse_iso_datetime(end_time)
         else:
-            end_time = None
+            task.end_time = None
             
-        return cls(
-            task_id=data.get('task_id', str(uuid.uuid4())),
-            draft_uuid=data.get('draft_uuid', ''),
-            file_url=data.get('file_url', ''),
-            local_path=data.get('local_path', ''),
-            file_size=data.get('file_size', 0),
-            downloaded_size=data.get('downloaded_size', 0),
-            status=data.get('status', 'queued'),
-            start_time=start_time,
-            end_time=end_time,
-            error_message=data.get('error_message'),
-            retries=data.get('retries', 0),
-            max_retries=data.get('max_retries', 3)
-        )
+        return task
         
     def to_dict(self):
         """
@@ -127,8 +161,8 @@ class DownloadTask:
         if self.file_size <= 0:
             return 0
             
-        progress = (self.downloaded_size / self.file_size) * 100
-        return min(int(progress), 100)
+        # Integer math gives the same truncated percentage without floats
+        return min(self.downloaded_size * 100 // self.file_size, 100)
         
     def get_status_display(self):
         """
@@ -137,14 +171,7 @@ class DownloadTask:
         Returns:
             str: Status string in Chinese
         """
-        status_map = {
-            'queued': '排队中',
-            'downloading': '下载中',
-            'completed': '已完成',
-            'failed': '失败',
-            'paused': '已暂停'
-        }
-        return status_map.get(self.status, self.status)
+        return _STATUS_DISPLAY.get(self.status, self.status)
         
     def can_retry(self):
         """
@@ -5,7 +5,47 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Optional
 
-@dataclass
+from utils.date_utils import parse_iso_datetime
+
+# (field name, default) pairs used by DraftModel.from_dict; remote_urls and
+# the datetime fields are resolved separately
+_FROM_DICT_DEFAULTS = (
+    ('id', 0),
+    ('uuid', ''),
+    ('name', ''),
+    ('description', ''),
+    ('file_count', 0),
+    ('total_size', 0),
+    ('status', 'pending'),
+    ('machine_name', ''),
+    ('local_path', ''),
+    ('error_message', None),
+    ('progress', 0)
+)
+
+# Column order of the rows accepted by DraftModel.from_rows
+ROW_COLUMNS = (
+    'id', 'uuid', 'name', 'description', 'file_count', 'total_size', 'status',
+    'created_at', 'updated_at', 'machine_name', 'local_path', 'error_message', 'progress'
+)
+
+# Display strings for each status
+_STATUS_DISPLAY = {
+    'pending': '等待中',
+    'downloading': '下载中',
+    'completed': '已完成',
+    'failed': '失败'
+}
+
+# (divisor, unit, format) for each size unit, indexed by bit_length // 10
+_SIZE_UNITS = (
+    (1, 'B', '{:.0f}'),
+    (1024, 'KB', '{:.1f}'),
+    (1024 * 1024, 'MB', '{:.1f}'),
+    (1024 * 1024 * 1024, 'GB', '{:.2f}')
+)
+
+@dataclass(slots=True)
 class DraftModel:
     """
     Data model for a draft box
@@ -38,41 +78,47 @@ class DraftModel:
         Returns:
             DraftModel: New DraftModel instance
         """
+        # Fill fields directly, skipping __init__ keyword binding
+        draft = cls.__new__(cls)
+        for name, default in _FROM_DICT_DEFAULTS:
+            setattr(draft, name, data.get(name, default))
+            
         # Convert string dates to datetime objects
         created_at = data.get('created_at')
         if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+            draft.created_at = parse_iso_datetime(created_at)
         else:
-            created_at = datetime.now()
+            draft.created_at = datetime.now()
             
         updated_at = data.get('updated_at')
         if isinstance(updated_at, str):
-            updated_at = datetime.fromisoformat(updated_at.replace('Z', '+00:00'))
+            draft.updated_at = parse_iso_datetime(updated_at)
         else:
-            updated_at = datetime.now()
+            draft.updated_at = datetime.now()
             
         # Extract remote URLs
         remote_urls = data.get('remote_urls', [])
         if isinstance(remote_urls, str):
             # Convert comma-separated string to list
             remote_urls = [url.strip() for url in remote_urls.split(',') if url.strip()]
+        draft.remote_urls = remote_urls
+            
+        return draft
+        
+    @classmethod
+    def from_rows(cls, rows):
+        """
+        Create DraftModels from database rows
+        
+        Args:
+            rows (list): Tuples in ROW_COLUMNS order; extra trailing
+                columns are ignored
             
-        return cls(
-            id=data.get('id', 0),
-            uuid=data.get('uuid', ''),
-            name=data.get('name', ''),
-            description=data.get('description', ''),
-            file_count=data.get('file_count', 0),
-            total_size=data.get('total_size', 0),
-            status=data.get('status', 'pending'),
-            created_at=created_at,
-            updated_at=updated_at,
-            machine_name=data.get('machine_name', ''),
-            local_path=data.get('local_path', ''),
-            remote_urls=remote_urls,
-            error_message=data.get('error_message'),
-            progress=data.get('progress', 0)
-        )
+        Returns:
+            list: New DraftModel instances
+        """
+        # Positional construction; remote_urls is not stored in the database
+        return [cls(*row[:11], [], *row[11:13]) for row in rows]
         
     def to_dict(self):
         """
@@ -105,13 +151,7 @@ class DraftModel:
         Returns:
             str: Status string in Chinese
         """
-        status_map = {
-            'pending': '等待中',
-            'downloading': '下载中',
-            'completed': '已完成',
-            'failed': '失败'
-        }
-        return status_map.get(self.status, self.status)
+        return _STATUS_DISPLAY.get(self.status, self.status)
         
     def get_formatted_size(self):
         """
@@ -120,13 +160,10 @@ class DraftModel:
         Returns:
             str: Formatted size string (e.g. "1.2 MB")
         """
-        size = self.total_size
+        # from_dict does not coerce, so the size may be a float or Decimal
+        size = self.total_size or 0
         
-        if size < 1024:
-            return f"{size} B"
-        elif size < 1024 * 1024:
-            return f"{size / 1024:.1f} KB"
-        elif size < 1024 * 1024 * 1024:
-            return f"{size / (1024 * 1024):.1f} MB"
-        else:
-            return f"{size / (1024 * 1024 * 1024):.2f} GB" 
\ No newline at end of file
+        # Each unit step is 10 bits, so the bit length selects the unit directly
+        index = min(max(int(size).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        divisor, unit, size_format = _SIZE_UNITS[index]
+        return size_format.format(size / divisor) + ' ' + unit 
\ No newline at end of file
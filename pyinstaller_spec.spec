@@ -1,28 +1,42 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+import os
+import pkgutil
+
 block_cipher = None
 
+# 遍历项目包收集所有子模块作为隐式导入，避免手动维护列表
+PROJECT_PACKAGES = ['config', 'handlers', 'models', 'services', 'ui', 'utils', 'workers']
+
+project_hiddenimports = [
+    module.name
+    for package in PROJECT_PACKAGES
+    for module in pkgutil.walk_packages([os.path.join(SPECPATH, package)], prefix=package + '.')
+]
+
 a = Analysis(
     ['main.py'],
     pathex=[],
     binaries=[],
     datas=[
         # 添加资源文件，格式为 (源路径, 目标路径)
-        # 如果您有资源文件夹，请取消下面的注释并修改路径
-        # ('assets', 'assets'),
-        # ('config', 'config'),
+        ('resources', 'resources'),
     ],
     hiddenimports=[
-        'PyQt6.QtCore',
-        'PyQt6.QtGui',
-        'PyQt6.QtWidgets',
         'PyQt6.QtSvg',
         'PyQt6.QtXml',
-    ],
+    ] + project_hiddenimports,
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # 排除运行时用不到的标准库模块，减小体积并加快启动
+    excludes=[
+        'tkinter',
+        'test',
+        'unittest',
+        'pydoc_data',
+        'distutils',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
@@ -44,23 +58,24 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=False,  # UPX压缩会拖慢启动时的解压
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
-    icon='assets/icon.ico',  # 如果有图标文件，请修改路径
+    icon='resources/icons/draft.ico',
 )
 
+# 使用onedir模式，避免onefile每次启动时解压到临时目录
 coll = COLLECT(
     exe,
     a.binaries,
     a.zipfiles,
     a.datas,
     strip=False,
-    upx=True,
+    upx=False,  # UPX压缩会拖慢启动时的解压
     upx_exclude=[],
     name='草稿箱管理系统',
 ) 
\ No newline at end of file
@@ -2,17 +2,41 @@
 # -*- coding: utf-8 -*-
 
 import os
+import atexit
 import logging
 import json
-import time
 import socket
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
+from urllib3.util.retry import Retry
 from typing import Dict, List, Any, Optional
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlsplit
 
 from config.settings import get_setting, get_int_setting
 
+# Prefer orjson for request/response bodies when it is installed
+try:
+    import orjson
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    _json_loads = json.loads
+
+# Status codes that are retried by the transport adapter
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# Maximum number of API requests issued concurrently by the bulk helpers
+MAX_CONCURRENT_REQUESTS = 32
+
+# Seconds between flushes of queued draft status updates
+STATUS_FLUSH_INTERVAL = 0.5
+
 class APIService:
     """Service for interacting with the backend API"""
     
@@ -38,8 +62,37 @@ class APIService:
         self.timeout = get_int_setting('API_TIMEOUT', 30)
         self.retry_count = get_int_setting('API_RETRY_COUNT', 3)
         
-        # Create a session for connection pooling
+        # Absolute endpoint paths resolve against scheme://host only, as in urljoin
+        base = urlsplit(self.base_url)
+        self._base_origin = f"{base.scheme}://{base.netloc}"
+        
+        # Create a session for connection pooling; retries and backoff are
+        # handled by the adapter instead of in _make_request
         self.session = requests.Session()
+        retry = Retry(
+            total=self.retry_count,
+            backoff_factor=1,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(['GET', 'PUT', 'POST', 'DELETE']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # The hostname does not change while the app is running
+        self._machine_name = socket.gethostname()
+        
+        # Worker threads for the bulk helpers, which share the pooled session
+        self._io_pool = ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS, thread_name_prefix='api-io')
+        
+        # Latest queued status update per draft, sent by a background flusher
+        self._pending_updates = {}
+        self._pending_lock = threading.Lock()
+        # Held across taking and sending a batch, so the exit flush cannot
+        # overtake a batch the flusher thread is still sending
+        self._send_lock = threading.Lock()
+        self._flusher = None
         
         # Set default headers
         self.session.headers.update({
@@ -57,9 +110,9 @@ class APIService:
         Returns:
             str: Machine name
         """
-        return socket.gethostname()
+        return self._machine_name
         
-    def _make_request(self, method, endpoint, params=None, data=None, headers=None, retry=0):
+    def _make_request(self, method, endpoint, params=None, data=None, headers=None):
         """
         Make an HTTP request to the API
         
@@ -69,7 +122,6 @@ class APIService:
             params (dict, optional): Query parameters
             data (dict, optional): Request body
             headers (dict, optional): Additional headers
-            retry (int, optional): Current retry count
             
         Returns:
             dict: Response data
@@ -77,17 +129,16 @@ class APIService:
         Raises:
             RequestException: If the request fails
         """
-        url = urljoin(self.base_url, endpoint)
+        if endpoint.startswith('/') and not endpoint.startswith('//'):
+            url = self._base_origin + endpoint
+        else:
+            url = urljoin(self.base_url, endpoint)
         
-        # Merge headers
-        request_headers = {}
-        if headers:
-            request_headers.update(headers)
-            
-        # Convert data to JSON if it's a dict
-        json_data = None
+        # Encode data as JSON if it's a dict; the session already sends the
+        # application/json Content-Type header
+        body = None
         if data and isinstance(data, dict):
-            json_data = data
+            body = _json_dumps(data)
             
         try:
             self.logger.debug("Making %s request to %s", method, url)
@@ -96,8 +147,8 @@ class APIService:
                 method=method,
                 url=url,
                 params=params,
-                json=json_data,
-                headers=request_headers,
+                data=body,
+                headers=headers,
                 timeout=self.timeout
             )
             
@@ -106,21 +157,11 @@ class APIService:
             
             # Parse JSON response
             if response.content:
-                return response.json()
+                return _json_loads(response.content)
             return {}
             
         except RequestException as e:
             self.logger.error("API request failed: %s", e)
-            
-            # Retry if we haven't reached the maximum retry count
-            if retry < self.retry_count:
-                # Exponential backoff
-                wait_time = 2 ** retry
-                self.logger.info("Retrying in %s seconds (retry %s/%s)", wait_time, retry + 1, self.retry_count)
-                time.sleep(wait_time)
-                return self._make_request(method, endpoint, params, data, headers, retry + 1)
-                
-            # If we've reached the maximum retry count, re-raise the exception
             raise
             
     def get_draft_by_uuid(self, uuid: str) -> Dict[str, Any]:
@@ -218,6 +259,51 @@ class APIService:
             
         return self._make_request('PUT', endpoint, data=data)
         
+    def queue_draft_status(self, uuid: str, status: str, progress: int = None, error_message: str = None):
+        """
+        Queue a status update for a draft without waiting for the request
+        
+        Updates queued for the same draft before the next flush are
+        coalesced, so only the latest one is sent.
+        
+        Args:
+            uuid (str): Draft UUID
+            status (str): New status
+            progress (int, optional): Download progress (0-100)
+            error_message (str, optional): Error message if status is 'failed'
+        """
+        with self._pending_lock:
+            self._pending_updates[uuid] = (status, progress, error_message)
+            
+            if self._flusher is None:
+                self._flusher = threading.Thread(target=self._flush_loop, name='api-status-flush', daemon=True)
+                self._flusher.start()
+                # The flusher is a daemon thread; send whatever is left on exit
+                atexit.register(self.flush_status_updates)
+                
+    def _flush_loop(self):
+        """Periodically send queued status updates"""
+        while True:
+            time.sleep(STATUS_FLUSH_INTERVAL)
+            self.flush_status_updates()
+            
+    def flush_status_updates(self):
+        """
+        Send all queued status updates now
+        
+        Failed updates are logged and dropped; a later update for the same
+        draft supersedes them anyway.
+        """
+        with self._send_lock:
+            with self._pending_lock:
+                pending, self._pending_updates = self._pending_updates, {}
+                
+            for uuid, (status, progress, error_message) in pending.items():
+                try:
+                    self.update_draft_status(uuid, status, progress, error_message)
+                except RequestException as e:
+                    self.logger.error("Failed to send status update for draft %s: %s", uuid, e)
+        
     def get_draft_files(self, uuid: str) -> List[Dict[str, Any]]:
         """
         Get the list of files in a draft
@@ -255,4 +341,21 @@ class APIService:
         }
         
         response = self._make_request('GET', endpoint, params=params)
-        return response.get('download_url', '') 
\ No newline at end of file
+        return response.get('download_url', '') 
+        
+    def get_file_download_urls(self, uuid: str, file_paths: List[str]) -> Dict[str, str]:
+        """
+        Get the download URLs for several files of a draft concurrently
+        
+        Args:
+            uuid (str): Draft UUID
+            file_paths (list): Paths of the files within the draft
+            
+        Returns:
+            dict: Download URL keyed by file path
+            
+        Raises:
+            RequestException: If any of the requests fails
+        """
+        urls = self._io_pool.map(lambda file_path: self.get_file_download_url(uuid, file_path), file_paths)
+        return dict(zip(file_paths, urls))
@@ -2,26 +2,74 @@
 # -*- coding: utf-8 -*-
 
 import os
+import errno
 import logging
 import time
 import shutil
+import threading
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Callable
 from concurrent.futures import ThreadPoolExecutor
-from PyQt6.QtCore import QObject, pyqtSignal
+from requests.exceptions import RequestException
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal, QThread, QCoreApplication, QMetaObject, Qt
 
 from config.settings import get_int_setting
 from models.download_task import DownloadTask
 from services.api_service import APIService
 from utils.file_utils import ensure_dir, get_free_space
 
+# Milliseconds between batched task_progress signals
+PROGRESS_EMIT_INTERVAL = 100
+
+# Draft files are binary, so ask for them uncompressed; this also keeps
+# Content-Length equal to the file size for progress reporting
+DOWNLOAD_HEADERS = {'Accept-Encoding': 'identity'}
+
+# Seconds a free-space reading is reused for other downloads to the same directory
+FREE_SPACE_CACHE_TTL = 2.0
+
+# Files of at least this size are split into parallel byte-range requests
+RANGE_PART_SIZE = 16 * 1024 * 1024
+RANGE_MAX_PARTS = 4
+
+# Userspace write buffer for downloaded files; several network chunks are
+# collected per write() syscall
+WRITE_BUFFER_BYTES = 1 << 20
+
+def _preallocate(f, size):
+    """
+    Reserve disk space for a file before writing it
+    
+    Args:
+        f (file): File opened for writing
+        size (int): Expected file size in bytes
+        
+    Returns:
+        bool: True if the space is now allocated to the file
+        
+    Raises:
+        OSError: If there is not enough disk space
+    """
+    try:
+        if hasattr(os, 'posix_fallocate'):
+            os.posix_fallocate(f.fileno(), 0, size)
+        else:
+            # On Windows extending the file allocates its clusters
+            f.truncate(size)
+    except OSError as e:
+        # Filesystems without preallocation support just grow the file as it is written
+        if e.errno == errno.ENOSPC:
+            raise
+        return False
+    return True
+
 class DownloadService(QObject):
     """Service for managing file downloads"""
     
     # Signals
     task_progress = pyqtSignal(str, int)  # task_id, progress
     task_started = pyqtSignal(str)  # task_id
-    task_completed = pyqtSignal(str)  # task_id
+    tasks_completed_batch = pyqtSignal(list)  # task_ids completed since the last progress tick
     task_failed = pyqtSignal(str, str)  # task_id, error_message
     task_paused = pyqtSignal(str)  # task_id
     all_tasks_completed = pyqtSignal()
@@ -53,16 +101,50 @@ class DownloadService(QObject):
         
         # Get download configuration from environment variables
         self.concurrent_count = get_int_setting('DOWNLOAD_CONCURRENT_COUNT', 5)
-        self.chunk_size = get_int_setting('DOWNLOAD_CHUNK_SIZE', 8192)
+        self.chunk_size = get_int_setting('DOWNLOAD_CHUNK_SIZE', 262144)
         self.timeout = get_int_setting('DOWNLOAD_TIMEOUT', 300)
         
         # Initialize task storage
         self.tasks = {}  # task_id -> DownloadTask
+        self.tasks_by_draft = {}  # draft_uuid -> {task_id -> DownloadTask}
         self.active_tasks = set()  # Set of active task IDs
-        self.queued_tasks = []  # List of queued task IDs
-        self.completed_tasks = []  # List of completed task IDs
-        self.failed_tasks = []  # List of failed task IDs
-        self.paused_tasks = []  # List of paused task IDs
+        # Dicts keyed by task ID keep insertion order with O(1) removal
+        self.queued_tasks = {}  # Queued task IDs
+        self.completed_tasks = {}  # Completed task IDs
+        self.failed_tasks = {}  # Failed task IDs
+        self.paused_tasks = {}  # Paused task IDs
+        
+        # Guards the task collections above, which the UI thread and the
+        # download workers both update
+        self._lock = threading.RLock()
+        
+        # Free space per filesystem, cached briefly, and the space reserved
+        # by downloads that have passed the disk space check but not yet
+        # preallocated their files
+        self._free_space_cache = {}  # device -> (timestamp, free bytes)
+        self._reserved_space = {}  # device -> {task_id: reserved bytes}
+        
+        # Directories already created for downloads
+        self._ensured_dirs = set()
+        
+        # Workers record the latest progress per task here; a timer on the
+        # UI thread drains it and emits task_progress, instead of every
+        # worker emitting a cross-thread signal per chunk
+        self._progress_buf = {}  # task_id -> progress
+        self._completed_buf = []  # task_ids for the next tasks_completed_batch
+        self._progress_lock = threading.Lock()
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setInterval(PROGRESS_EMIT_INTERVAL)
+        self._progress_timer.timeout.connect(self._flush_progress)
+        
+        # The service may be created lazily on a worker thread without an
+        # event loop; the timer only fires on the UI thread, so move there
+        app = QCoreApplication.instance()
+        if app is not None and QThread.currentThread() != app.thread():
+            self.moveToThread(app.thread())
+            QMetaObject.invokeMethod(self._progress_timer, "start", Qt.ConnectionType.QueuedConnection)
+        else:
+            self._progress_timer.start()
         
         # Create thread pool
         self.executor = ThreadPoolExecutor(max_workers=self.concurrent_count)
@@ -83,20 +165,22 @@ class DownloadService(QObject):
         Returns:
             str: Task ID
         """
-        self.logger.debug("Adding download task: %s", task.task_id)
-        
-        # Store the task
-        self.tasks[task.task_id] = task
-        
-        # Add to queued tasks
-        if task.status == self.STATUS_QUEUED:
-            self.queued_tasks.append(task.task_id)
+        with self._lock:
+            self.logger.debug("Adding download task: %s", task.task_id)
             
-        # Start the task if we have capacity
-        if len(self.active_tasks) < self.concurrent_count and task.status == self.STATUS_QUEUED:
-            self._start_task(task.task_id)
+            # Store the task
+            self.tasks[task.task_id] = task
+            self.tasks_by_draft.setdefault(task.draft_uuid, {})[task.task_id] = task
             
-        return task.task_id
+            # Add to queued tasks
+            if task.status == self.STATUS_QUEUED:
+                self.queued_tasks[task.task_id] = None
+                
+            # Start the task if we have capacity
+            if len(self.active_tasks) < self.concurrent_count and task.status == self.STATUS_QUEUED:
+                self._start_task(task.task_id)
+                
+            return task.task_id
         
     def add_tasks(self, tasks: List[DownloadTask]) -> List[str]:
         """
@@ -108,12 +192,17 @@ class DownloadService(QObject):
         Returns:
             List[str]: List of task IDs
         """
-        task_ids = []
-        for task in tasks:
-            task_id = self.add_task(task)
-            task_ids.append(task_id)
+        with self._lock:
+            # Register all tasks at once, then fill the free download slots once
+            self.tasks.update((task.task_id, task) for task in tasks)
+            self.queued_tasks.update((task.task_id, None) for task in tasks if task.status == self.STATUS_QUEUED)
+            for task in tasks:
+                self.tasks_by_draft.setdefault(task.draft_uuid, {})[task.task_id] = task
+                
+            self.logger.debug("Added %s download tasks", len(tasks))
+            self._fill_workers()
             
-        return task_ids
+        return [task.task_id for task in tasks]
         
     def get_task(self, task_id: str) -> Optional[DownloadTask]:
         """
@@ -137,7 +226,7 @@ class DownloadService(QObject):
         Returns:
             List[DownloadTask]: List of download tasks
         """
-        return [task for task in self.tasks.values() if task.draft_uuid == draft_uuid]
+        return list(self.tasks_by_draft.get(draft_uuid, {}).values())
         
     def get_all_tasks(self) -> List[DownloadTask]:
         """
@@ -158,35 +247,36 @@ class DownloadService(QObject):
         Returns:
             bool: True if the task was paused, False otherwise
         """
-        task = self.get_task(task_id)
-        if not task:
-            self.logger.warning("Cannot pause task %s: Task not found", task_id)
-            return False
-            
-        # Can only pause active tasks
-        if task_id not in self.active_tasks:
-            self.logger.warning("Cannot pause task %s: Task is not active", task_id)
-            return False
-            
-        # Cancel the future
-        if task_id in self.futures:
-            self.futures[task_id].cancel()
-            del self.futures[task_id]
+        with self._lock:
+            task = self.get_task(task_id)
+            if not task:
+                self.logger.warning("Cannot pause task %s: Task not found", task_id)
+                return False
+                
+            # Can only pause active tasks
+            if task_id not in self.active_tasks:
+                self.logger.warning("Cannot pause task %s: Task is not active", task_id)
+                return False
+                
+            # Cancel the future
+            if task_id in self.futures:
+                self.futures[task_id].cancel()
+                del self.futures[task_id]
+                
+            # Update task status
+            task.status = self.STATUS_PAUSED
+            self.active_tasks.remove(task_id)
+            self.paused_tasks[task_id] = None
             
-        # Update task status
-        task.status = self.STATUS_PAUSED
-        self.active_tasks.remove(task_id)
-        self.paused_tasks.append(task_id)
-        
-        # Emit signal
-        self.task_paused.emit(task_id)
-        
-        # Start next task if there are queued tasks
-        if self.queued_tasks:
-            next_task_id = self.queued_tasks[0]
-            self._start_task(next_task_id)
+            # Emit signal
+            self.task_paused.emit(task_id)
             
-        return True
+            # Start next task if there are queued tasks
+            if self.queued_tasks:
+                next_task_id = next(iter(self.queued_tasks))
+                self._start_task(next_task_id)
+                
+            return True
         
     def resume_task(self, task_id: str) -> bool:
         """
@@ -198,26 +288,27 @@ class DownloadService(QObject):
         Returns:
             bool: True if the task was resumed, False otherwise
         """
-        task = self.get_task(task_id)
-        if not task:
-            self.logger.warning("Cannot resume task %s: Task not found", task_id)
-            return False
-            
-        # Can only resume paused tasks
-        if task.status != self.STATUS_PAUSED:
-            self.logger.warning("Cannot resume task %s: Task is not paused", task_id)
-            return False
-            
-        # Update task status
-        task.status = self.STATUS_QUEUED
-        self.paused_tasks.remove(task_id)
-        self.queued_tasks.append(task_id)
-        
-        # Start the task if we have capacity
-        if len(self.active_tasks) < self.concurrent_count:
-            self._start_task(task_id)
-            
-        return True
+        with self._lock:
+            task = self.get_task(task_id)
+            if not task:
+                self.logger.warning("Cannot resume task %s: Task not found", task_id)
+                return False
+                
+            # Can only resume paused tasks
+            if task.status != self.STATUS_PAUSED:
+                self.logger.warning("Cannot resume task %s: Task is not paused", task_id)
+                return False
+                
+            # Update task status
+            task.status = self.STATUS_QUEUED
+            del self.paused_tasks[task_id]
+            self.queued_tasks[task_id] = None
+            
+            # Start the task if we have capacity
+            if len(self.active_tasks) < self.concurrent_count:
+                self._start_task(task_id)
+                
+            return True
         
     def cancel_task(self, task_id: str) -> bool:
         """
@@ -229,32 +320,37 @@ class DownloadService(QObject):
         Returns:
             bool: True if the task was cancelled, False otherwise
         """
-        task = self.get_task(task_id)
-        if not task:
-            self.logger.warning("Cannot cancel task %s: Task not found", task_id)
-            return False
-            
-        # Cancel the future if the task is active
-        if task_id in self.active_tasks and task_id in self.futures:
-            self.futures[task_id].cancel()
-            del self.futures[task_id]
-            self.active_tasks.remove(task_id)
-            
-        # Remove from queued/paused tasks
-        if task_id in self.queued_tasks:
-            self.queued_tasks.remove(task_id)
-        if task_id in self.paused_tasks:
-            self.paused_tasks.remove(task_id)
-            
-        # Delete the task
-        del self.tasks[task_id]
-        
-        # Start next task if there are queued tasks
-        if len(self.active_tasks) < self.concurrent_count and self.queued_tasks:
-            next_task_id = self.queued_tasks[0]
-            self._start_task(next_task_id)
+        with self._lock:
+            task = self.get_task(task_id)
+            if not task:
+                self.logger.warning("Cannot cancel task %s: Task not found", task_id)
+                return False
+                
+            # Cancel the future if the task is active
+            if task_id in self.active_tasks and task_id in self.futures:
+                self.futures[task_id].cancel()
+                del self.futures[task_id]
+                self.active_tasks.remove(task_id)
+                
+            # Remove from queued/paused tasks
+            if task_id in self.queued_tasks:
+                del self.queued_tasks[task_id]
+            if task_id in self.paused_tasks:
+                del self.paused_tasks[task_id]
+                
+            # Delete the task
+            del self.tasks[task_id]
+            draft_tasks = self.tasks_by_draft[task.draft_uuid]
+            del draft_tasks[task_id]
+            if not draft_tasks:
+                del self.tasks_by_draft[task.draft_uuid]
             
-        return True
+            # Start next task if there are queued tasks
+            if len(self.active_tasks) < self.concurrent_count and self.queued_tasks:
+                next_task_id = next(iter(self.queued_tasks))
+                self._start_task(next_task_id)
+                
+            return True
         
     def retry_task(self, task_id: str) -> bool:
         """
@@ -266,32 +362,40 @@ class DownloadService(QObject):
         Returns:
             bool: True if the task was retried, False otherwise
         """
-        task = self.get_task(task_id)
-        if not task:
-            self.logger.warning("Cannot retry task %s: Task not found", task_id)
-            return False
-            
-        # Can only retry failed tasks
-        if task.status != self.STATUS_FAILED:
-            self.logger.warning("Cannot retry task %s: Task is not failed", task_id)
-            return False
-            
-        # Check if the task can be retried
-        if not task.can_retry():
-            self.logger.warning("Cannot retry task %s: Maximum retry count reached", task_id)
-            return False
-            
-        # Update task status
-        task.retry()
-        self.failed_tasks.remove(task_id)
-        self.queued_tasks.append(task_id)
-        
-        # Start the task if we have capacity
-        if len(self.active_tasks) < self.concurrent_count:
-            self._start_task(task_id)
-            
-        return True
+        with self._lock:
+            task = self.get_task(task_id)
+            if not task:
+                self.logger.warning("Cannot retry task %s: Task not found", task_id)
+                return False
+                
+            # Can only retry failed tasks
+            if task.status != self.STATUS_FAILED:
+                self.logger.warning("Cannot retry task %s: Task is not failed", task_id)
+                return False
+                
+            # Check if the task can be retried
+            if not task.can_retry():
+                self.logger.warning("Cannot retry task %s: Maximum retry count reached", task_id)
+                return False
+                
+            # Update task status
+            task.retry()
+            del self.failed_tasks[task_id]
+            self.queued_tasks[task_id] = None
+            
+            # Start the task if we have capacity
+            if len(self.active_tasks) < self.concurrent_count:
+                self._start_task(task_id)
+                
+            return True
         
+    def _fill_workers(self):
+        """Start queued tasks until all download slots are in use"""
+        with self._lock:
+            while self.queued_tasks and len(self.active_tasks) < self.concurrent_count:
+                if not self._start_task(next(iter(self.queued_tasks))):
+                    break
+                
     def _start_task(self, task_id: str) -> bool:
         """
         Start a download task
@@ -302,34 +406,35 @@ class DownloadService(QObject):
         Returns:
             bool: True if the task was started, False otherwise
         """
-        task = self.get_task(task_id)
-        if not task:
-            self.logger.warning("Cannot start task %s: Task not found", task_id)
-            return False
+        with self._lock:
+            task = self.get_task(task_id)
+            if not task:
+                self.logger.warning("Cannot start task %s: Task not found", task_id)
+                return False
+                
+            # Check if the task is queued
+            if task.status != self.STATUS_QUEUED:
+                self.logger.warning("Cannot start task %s: Task is not queued", task_id)
+                return False
+                
+            # Check if we have capacity
+            if len(self.active_tasks) >= self.concurrent_count:
+                self.logger.warning("Cannot start task %s: Maximum concurrent downloads reached", task_id)
+                return False
+                
+            # Update task status
+            task.status = self.STATUS_DOWNLOADING
+            del self.queued_tasks[task_id]
+            self.active_tasks.add(task_id)
             
-        # Check if the task is queued
-        if task.status != self.STATUS_QUEUED:
-            self.logger.warning("Cannot start task %s: Task is not queued", task_id)
-            return False
+            # Emit signal
+            self.task_started.emit(task_id)
             
-        # Check if we have capacity
-        if len(self.active_tasks) >= self.concurrent_count:
-            self.logger.warning("Cannot start task %s: Maximum concurrent downloads reached", task_id)
-            return False
+            # Submit task to thread pool
+            future = self.executor.submit(self._download_file, task)
+            self.futures[task_id] = future
             
-        # Update task status
-        task.status = self.STATUS_DOWNLOADING
-        self.queued_tasks.remove(task_id)
-        self.active_tasks.add(task_id)
-        
-        # Emit signal
-        self.task_started.emit(task_id)
-        
-        # Submit task to thread pool
-        future = self.executor.submit(self._download_file, task)
-        self.futures[task_id] = future
-        
-        return True
+            return True
         
     def _download_file(self, task: DownloadTask) -> bool:
         """
@@ -346,88 +451,330 @@ class DownloadService(QObject):
         try:
             # Create directory if it doesn't exist
             directory = os.path.dirname(task.local_path)
-            ensure_dir(directory)
+            self._ensure_dirs([directory])
             
-            # Check disk space
+            # Check disk space, net of what other running downloads will still use
             file_size = task.file_size
-            free_space = get_free_space(directory)
+            free_space = self._reserve_space(task, directory)
             
             if file_size > free_space:
                 error_msg = f"Not enough disk space. Required: {file_size}, Available: {free_space}"
                 self._handle_task_failure(task, error_msg)
                 return False
                 
-            # Start download
-            with open(task.local_path, 'wb') as f:
-                # Make request
-                with self.api_service.session.get(
-                    task.file_url,
-                    stream=True,
-                    timeout=self.timeout
-                ) as response:
-                    response.raise_for_status()
-                    
-                    # Get content length if not provided
-                    if task.file_size <= 0 and 'content-length' in response.headers:
-                        task.file_size = int(response.headers['content-length'])
-                        
-                    # Download the file in chunks
-                    for chunk in response.iter_content(chunk_size=self.chunk_size):
-                        if chunk:
-                            f.write(chunk)
-                            task.downloaded_size += len(chunk)
-                            
-                            # Update progress
-                            progress = task.get_progress()
-                            self.task_progress.emit(task.task_id, progress)
-                            
+            # Start download; large files are fetched as parallel byte ranges
+            # when the server supports it
+            if task.file_size >= 2 * RANGE_PART_SIZE and self._supports_ranges(task):
+                self._download_ranges(task)
+            else:
+                self._download_stream(task)
+                
             # Mark task as completed
-            task.mark_completed()
-            self.active_tasks.remove(task.task_id)
-            self.completed_tasks.append(task.task_id)
-            
-            # Emit signal
-            self.task_completed.emit(task.task_id)
-            
-            # Start next task if there are queued tasks
-            if self.queued_tasks:
-                next_task_id = self.queued_tasks[0]
-                self._start_task(next_task_id)
+            with self._lock:
+                task.mark_completed()
+                self._release_space(task.task_id)
+                self.active_tasks.remove(task.task_id)
+                self.completed_tasks[task.task_id] = None
                 
-            # Check if all tasks are completed
-            if not self.active_tasks and not self.queued_tasks:
-                self.all_tasks_completed.emit()
+                # Announced with the next progress tick, at most one batch per interval
+                with self._progress_lock:
+                    self._completed_buf.append(task.task_id)
                 
+                # Start next task if there are queued tasks
+                if self.queued_tasks:
+                    next_task_id = next(iter(self.queued_tasks))
+                    self._start_task(next_task_id)
+                    
+                # Check if all tasks are completed
+                if not self.active_tasks and not self.queued_tasks:
+                    self.all_tasks_completed.emit()
+                    
             return True
                 
         except Exception as e:
             self._handle_task_failure(task, str(e))
             return False
             
-    def _handle_task_failure(self, task: DownloadTask, error_message: str):
+    def _ensure_dirs(self, directories):
         """
-        Handle task failure
+        Create directories that haven't been created yet
+        
+        Args:
+            directories (iterable): Directory paths
+        """
+        for directory in directories:
+            # ensure_dir is idempotent, so a race between workers is harmless
+            if directory not in self._ensured_dirs and ensure_dir(directory):
+                self._ensured_dirs.add(directory)
+                
+    def _reserve_space(self, task: DownloadTask, directory: str) -> int:
+        """
+        Reserve disk space for a download if there is enough of it
         
         Args:
             task (DownloadTask): Download task
-            error_message (str): Error message
+            directory (str): Directory the file is saved to
+            
+        Returns:
+            int: Free space in bytes, less the space reserved by other
+            downloads to the same filesystem; the task is reserved only if it fits
+        """
+        # Reservations only compete for the filesystem they are written to
+        device = os.stat(directory).st_dev
+        with self._lock:
+            now = time.monotonic()
+            cached = self._free_space_cache.get(device)
+            if cached is None or now - cached[0] > FREE_SPACE_CACHE_TTL:
+                cached = (now, get_free_space(directory))
+                self._free_space_cache[device] = cached
+                
+            reserved = self._reserved_space.setdefault(device, {})
+            available = cached[1] - sum(reserved.values())
+            if task.file_size <= available:
+                reserved[task.task_id] = task.file_size
+            return available
+            
+    def _release_space(self, task_id: str, allocated: bool = False):
         """
-        self.logger.error("Download task %s failed: %s", task.task_id, error_message)
+        Drop a task's disk space reservation
         
-        # Mark task as failed
-        task.mark_failed(error_message)
+        Args:
+            task_id (str): Task ID
+            allocated (bool): Whether the file now holds the reserved space;
+                the cached free space is then lowered by it until the next
+                measurement, which already accounts for it
+        """
+        with self._lock:
+            for device, reserved in self._reserved_space.items():
+                size = reserved.pop(task_id, None)
+                cached = self._free_space_cache.get(device)
+                if allocated and size and cached:
+                    self._free_space_cache[device] = (cached[0], cached[1] - size)
+                
+    def _download_stream(self, task: DownloadTask):
+        """
+        Download a file over a single streamed request
         
-        # Update task lists
-        self.active_tasks.remove(task.task_id)
-        self.failed_tasks.append(task.task_id)
+        Args:
+            task (DownloadTask): Download task
+            
+        Raises:
+            RequestException: If the request fails
+        """
+        with open(task.local_path, 'wb', buffering=WRITE_BUFFER_BYTES) as f:
+            # Make request
+            with self.api_service.session.get(
+                task.file_url,
+                headers=DOWNLOAD_HEADERS,
+                stream=True,
+                timeout=self.timeout
+            ) as response:
+                response.raise_for_status()
+                
+                # Get content length if not provided
+                if task.file_size <= 0 and 'content-length' in response.headers:
+                    task.file_size = int(response.headers['content-length'])
+                    
+                # Reserve the space up front to fail fast and avoid fragmentation
+                if task.file_size > 0 and _preallocate(f, task.file_size):
+                    self._release_space(task.task_id, allocated=True)
+                    
+                # Download the file in chunks, keeping the hot loop on locals
+                write = f.write
+                task_id = task.task_id
+                total = task.file_size
+                downloaded = task.downloaded_size
+                last_progress = None
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if chunk:
+                        write(chunk)
+                        downloaded += len(chunk)
+                        
+                        # Only touch the task and the shared buffer when the percentage changes
+                        progress = min(downloaded * 100 // total, 100) if total > 0 else 0
+                        if progress != last_progress:
+                            last_progress = progress
+                            task.downloaded_size = downloaded
+                            self._report_progress(task_id, progress)
+                            
+                task.downloaded_size = downloaded
+                
+                # Drop any preallocated space the download didn't use
+                f.truncate()
+                
+    def _supports_ranges(self, task: DownloadTask) -> bool:
+        """
+        Check whether the server can serve byte ranges of a file
+        
+        Args:
+            task (DownloadTask): Download task
+            
+        Returns:
+            bool: True if the file can be downloaded in ranges
+        """
+        try:
+            response = self.api_service.session.head(
+                task.file_url,
+                headers=DOWNLOAD_HEADERS,
+                allow_redirects=True,
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+        except RequestException as e:
+            self.logger.debug("Range probe failed for %s: %s", task.file_url, e)
+            return False
+            
+        # The advertised length must match, otherwise the ranges would not line up
+        return (response.headers.get('Accept-Ranges', '').lower() == 'bytes'
+                and response.headers.get('Content-Length') == str(task.file_size))
         
-        # Emit signal
-        self.task_failed.emit(task.task_id, error_message)
+    def _download_ranges(self, task: DownloadTask):
+        """
+        Download a file as several byte ranges in parallel
         
-        # Start next task if there are queued tasks
-        if self.queued_tasks:
-            next_task_id = self.queued_tasks[0]
-            self._start_task(next_task_id)
+        Args:
+            task (DownloadTask): Download task with a known file size
+            
+        Raises:
+            RequestException: If a range request fails
+            IOError: If the server does not honour a range request
+        """
+        parts = min(RANGE_MAX_PARTS, task.file_size // RANGE_PART_SIZE)
+        part_size = -(-task.file_size // parts)
+        
+        # Pre-allocate the file so each part can write at its own offset
+        with open(task.local_path, 'wb') as f:
+            if _preallocate(f, task.file_size):
+                self._release_space(task.task_id, allocated=True)
+            f.truncate(task.file_size)
+            
+        progress_lock = threading.Lock()
+        with ThreadPoolExecutor(max_workers=parts) as pool:
+            futures = [
+                pool.submit(self._download_range, task, start, min(start + part_size, task.file_size) - 1, progress_lock)
+                for start in range(0, task.file_size, part_size)
+            ]
+            
+            # Re-raise the first failed part
+            for future in futures:
+                future.result()
+                
+    def _download_range(self, task: DownloadTask, start: int, end: int, progress_lock):
+        """
+        Download one byte range of a file into place
+        
+        Args:
+            task (DownloadTask): Download task
+            start (int): First byte of the range
+            end (int): Last byte of the range, inclusive
+            progress_lock (threading.Lock): Lock guarding task.downloaded_size
+            
+        Raises:
+            RequestException: If the request fails
+            IOError: If the server does not honour the range request
+        """
+        headers = dict(DOWNLOAD_HEADERS, Range=f"bytes={start}-{end}")
+        
+        with open(task.local_path, 'r+b', buffering=WRITE_BUFFER_BYTES) as f, self.api_service.session.get(
+            task.file_url,
+            headers=headers,
+            stream=True,
+            timeout=self.timeout
+        ) as response:
+            response.raise_for_status()
+            
+            if response.status_code != 206:
+                raise IOError(f"Server ignored range request for bytes {start}-{end}")
+                
+            f.seek(start)
+            
+            # Count bytes locally and publish them about once per percent,
+            # since the percentage cannot change in between
+            write = f.write
+            total = task.file_size
+            step = max(total // 100, 1)
+            unreported = 0
+            for chunk in response.iter_content(chunk_size=self.chunk_size):
+                if chunk:
+                    write(chunk)
+                    unreported += len(chunk)
+                    if unreported >= step:
+                        self._add_range_progress(task, unreported, progress_lock)
+                        unreported = 0
+                        
+            if unreported:
+                self._add_range_progress(task, unreported, progress_lock)
+                
+    def _add_range_progress(self, task: DownloadTask, size: int, progress_lock):
+        """
+        Add bytes fetched by a range worker to the task's progress
+        
+        Args:
+            task (DownloadTask): Download task
+            size (int): Bytes written since the last call
+            progress_lock (threading.Lock): Lock guarding task.downloaded_size
+        """
+        with progress_lock:
+            previous = task.downloaded_size * 100 // task.file_size
+            task.downloaded_size += size
+            progress = min(task.downloaded_size * 100 // task.file_size, 100)
+            if progress != previous:
+                self._report_progress(task.task_id, progress)
+                
+    def _report_progress(self, task_id: str, progress: int):
+        """
+        Record a task's progress for the next batched task_progress signal
+        
+        Args:
+            task_id (str): Task ID
+            progress (int): Progress percentage (0-100)
+        """
+        with self._progress_lock:
+            self._progress_buf[task_id] = progress
+            
+    def _flush_progress(self):
+        """
+        Emit task_progress for every task whose progress changed since the
+        last flush, then tasks_completed_batch for tasks completed since then
+        """
+        with self._progress_lock:
+            if not self._progress_buf and not self._completed_buf:
+                return
+            pending, self._progress_buf = self._progress_buf, {}
+            completed, self._completed_buf = self._completed_buf, []
+            
+        for task_id, progress in pending.items():
+            self.task_progress.emit(task_id, progress)
+            
+        if completed:
+            self.tasks_completed_batch.emit(completed)
+            
+    def _handle_task_failure(self, task: DownloadTask, error_message: str):
+        """
+        Handle task failure
+        
+        Args:
+            task (DownloadTask): Download task
+            error_message (str): Error message
+        """
+        with self._lock:
+            self.logger.error("Download task %s failed: %s", task.task_id, error_message)
+            
+            # Mark task as failed
+            task.mark_failed(error_message)
+            self._release_space(task.task_id)
+            
+            # Update task lists
+            self.active_tasks.remove(task.task_id)
+            self.failed_tasks[task.task_id] = None
+            
+            # Emit signal
+            self.task_failed.emit(task.task_id, error_message)
+            
+            # Start next task if there are queued tasks
+            if self.queued_tasks:
+                next_task_id = next(iter(self.queued_tasks))
+                self._start_task(next_task_id)
             
     def create_tasks_for_draft(self, draft_uuid: str, files: List[Dict[str, Any]], base_path: str) -> List[str]:
         """
@@ -442,10 +789,20 @@ class DownloadService(QObject):
             List[str]: List of task IDs
         """
         tasks = []
-        
+        directories = set()
+        
+        # Files listed without a URL get one from the API, looked up concurrently
+        unresolved = [file_data['path'] for file_data in files if file_data.get('path') and not file_data.get('url')]
+        resolved_urls = {}
+        if unresolved:
+            try:
+                resolved_urls = self.api_service.get_file_download_urls(draft_uuid, unresolved)
+            except RequestException as e:
+                self.logger.error("Failed to get download URLs for draft %s: %s", draft_uuid, e)
+                
         for file_data in files:
             file_path = file_data.get('path', '')
-            file_url = file_data.get('url', '')
+            file_url = file_data.get('url') or resolved_urls.get(file_path, '')
             file_size = file_data.get('size', 0)
             
             if not file_url:
@@ -454,6 +811,7 @@ class DownloadService(QObject):
                 
             # Create local path
             local_path = os.path.join(base_path, file_path)
+            directories.add(os.path.dirname(local_path))
             
             # Create task
             task = DownloadTask.create(
@@ -465,6 +823,9 @@ class DownloadService(QObject):
             
             tasks.append(task)
             
+        # Create each target directory once instead of once per file
+        self._ensure_dirs(directories)
+        
         # Add tasks
         task_ids = self.add_tasks(tasks)
         
@@ -509,20 +870,23 @@ class DownloadService(QObject):
         if not tasks:
             return self.STATUS_COMPLETED
             
+        # Collect the statuses in one pass, then check them by priority
+        statuses = {task.status for task in tasks}
+        
         # If any task is downloading, the draft is downloading
-        if any(task.status == self.STATUS_DOWNLOADING for task in tasks):
+        if self.STATUS_DOWNLOADING in statuses:
             return self.STATUS_DOWNLOADING
             
         # If any task is queued, the draft is queued
-        if any(task.status == self.STATUS_QUEUED for task in tasks):
+        if self.STATUS_QUEUED in statuses:
             return self.STATUS_QUEUED
             
         # If any task is paused, the draft is paused
-        if any(task.status == self.STATUS_PAUSED for task in tasks):
+        if self.STATUS_PAUSED in statuses:
             return self.STATUS_PAUSED
             
         # If any task is failed, the draft is failed
-        if any(task.status == self.STATUS_FAILED for task in tasks):
+        if self.STATUS_FAILED in statuses:
             return self.STATUS_FAILED
             
         # If all tasks are completed, the draft is completed
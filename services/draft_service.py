@@ -2,16 +2,184 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
+import copy
+import time
+import shutil
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+from requests.exceptions import HTTPError
 
-from models.draft_model import DraftModel
+from models.draft_model import DraftModel, ROW_COLUMNS
 from services.api_service import APIService
 from services.database_service import DatabasePool
 from services.download_service import DownloadService
 from utils.file_utils import ensure_dir
 
+# 草稿箱缓存的最大条数和有效期（秒）
+DRAFT_CACHE_SIZE = 512
+DRAFT_CACHE_TTL = 60
+
+# 删除本地草稿箱文件夹的后台线程，大文件夹删除可能耗时数秒
+_delete_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='draft-rm')
+
+# 服务器上也不存在的UUID在此时间内直接返回None，不再请求API
+DRAFT_MISS_TTL = 10
+
+# 插入草稿箱，uuid已存在时更新（created_at保持不变）；updated_at取数据库时钟
+_SQL_UPSERT = """
+    INSERT INTO drafts (
+    uuid, name, description, file_count, total_size,
+    status, created_at, updated_at, machine_name,
+    local_path, error_message, progress
+    ) VALUES (%s, %s, %s, %s, %s, %s, COALESCE(%s, NOW()), NOW(), %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE
+    name = VALUES(name),
+    description = VALUES(description),
+    file_count = VALUES(file_count),
+    total_size = VALUES(total_size),
+    status = VALUES(status),
+    updated_at = VALUES(updated_at),
+    machine_name = VALUES(machine_name),
+    local_path = VALUES(local_path),
+    error_message = VALUES(error_message),
+    progress = VALUES(progress)
+"""
+
+# 高频查询固定为常量，以便作为预处理语句在连接上复用
+_DRAFT_COLUMNS = ", ".join(ROW_COLUMNS)
+
+_SQL_GET_BY_UUID = f"SELECT {_DRAFT_COLUMNS} FROM drafts WHERE uuid = %s"
+
+_SQL_UPDATE_STATUS = """
+    UPDATE drafts SET
+    status = %s,
+    progress = COALESCE(%s, progress),
+    error_message = COALESCE(%s, error_message),
+    updated_at = NOW()
+    WHERE uuid = %s
+"""
+
+_SQL_DELETE = "DELETE FROM drafts WHERE uuid = %s"
+
+# 列表按(updated_at, id)倒序，id保证翻页顺序稳定；*_AFTER版本为键集分页，
+# 从上一页最后一条之后继续，走(status, updated_at, id)索引而不必扫描OFFSET行。
+# MySQL不会对行构造器比较(updated_at, id) < (...)使用范围扫描，故展开书写，
+# 参数见_keyset_params
+_KEYSET_BEFORE = "(updated_at < %s OR (updated_at = %s AND id < %s))"
+
+_SQL_LIST = f"SELECT {_DRAFT_COLUMNS} FROM drafts ORDER BY updated_at DESC, id DESC LIMIT %s OFFSET %s"
+
+_SQL_LIST_BY_STATUS = (
+    f"SELECT {_DRAFT_COLUMNS} FROM drafts WHERE status = %s "
+    "ORDER BY updated_at DESC, id DESC LIMIT %s OFFSET %s"
+)
+
+_SQL_LIST_AFTER = (
+    f"SELECT {_DRAFT_COLUMNS} FROM drafts WHERE {_KEYSET_BEFORE} "
+    "ORDER BY updated_at DESC, id DESC LIMIT %s"
+)
+
+_SQL_LIST_BY_STATUS_AFTER = (
+    f"SELECT {_DRAFT_COLUMNS} FROM drafts WHERE status = %s AND {_KEYSET_BEFORE} "
+    "ORDER BY updated_at DESC, id DESC LIMIT %s"
+)
+
+# 分页列表连同总数一次查出，省去单独的COUNT查询
+_SQL_LIST_WITH_TOTAL = (
+    f"SELECT {_DRAFT_COLUMNS}, COUNT(*) OVER () AS total FROM drafts "
+    "ORDER BY updated_at DESC, id DESC LIMIT %s OFFSET %s"
+)
+
+_SQL_LIST_BY_STATUS_WITH_TOTAL = (
+    f"SELECT {_DRAFT_COLUMNS}, COUNT(*) OVER () AS total FROM drafts WHERE status = %s "
+    "ORDER BY updated_at DESC, id DESC LIMIT %s OFFSET %s"
+)
+
+_SQL_COUNT = "SELECT COUNT(*) as count FROM drafts"
+
+_SQL_COUNT_BY_STATUS = "SELECT COUNT(*) as count FROM drafts WHERE status = %s"
+
+# 含中日韩文字的关键词走(name, description)上的ngram全文索引；uuid不含这些文字，
+# 无需再匹配
+_SQL_SEARCH = f"""
+    SELECT {_DRAFT_COLUMNS} FROM drafts
+    WHERE MATCH(name, description) AGAINST (%s IN BOOLEAN MODE)
+    ORDER BY updated_at DESC, id DESC
+    LIMIT %s OFFSET %s
+"""
+
+_SQL_SEARCH_AFTER = f"""
+    SELECT {_DRAFT_COLUMNS} FROM drafts
+    WHERE MATCH(name, description) AGAINST (%s IN BOOLEAN MODE)
+      AND {_KEYSET_BEFORE}
+    ORDER BY updated_at DESC, id DESC
+    LIMIT %s
+"""
+
+# 其余关键词及没有全文索引时（如MariaDB没有ngram分词器）用子串匹配：
+# 短于ngram分词长度的无法命中全文索引；
+# 纯ASCII等关键词的ngram分词会被InnoDB默认停用词（如"a"、"i"）过滤，
+# "data"、"trip"这类名称会搜不到
+SEARCH_MIN_TOKEN = 2
+
+_CJK_PATTERN = re.compile(r'[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af\uf900-\ufaff]')
+
+_SQL_SEARCH_LIKE = f"""
+    SELECT {_DRAFT_COLUMNS} FROM drafts
+    WHERE name LIKE %s OR description LIKE %s OR uuid LIKE %s
+    ORDER BY updated_at DESC, id DESC
+    LIMIT %s OFFSET %s
+"""
+
+_SQL_SEARCH_LIKE_AFTER = f"""
+    SELECT {_DRAFT_COLUMNS} FROM drafts
+    WHERE (name LIKE %s OR description LIKE %s OR uuid LIKE %s)
+      AND {_KEYSET_BEFORE}
+    ORDER BY updated_at DESC, id DESC
+    LIMIT %s
+"""
+
+
+def _keyset_params(after: Tuple[datetime, int]) -> Tuple[datetime, datetime, int]:
+    """展开上一页最后一条的(updated_at, id)，对应_KEYSET_BEFORE的参数"""
+    updated_at, draft_id = after
+    return (updated_at, updated_at, draft_id)
+
+
+def _escape_like(value: str) -> str:
+    """转义LIKE通配符"""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+def _upsert_params(draft: DraftModel) -> tuple:
+    """
+    生成_SQL_UPSERT的参数
+    
+    Args:
+        draft (DraftModel): 草稿箱模型
+        
+    Returns:
+        tuple: 查询参数
+    """
+    return (
+        draft.uuid,
+        draft.name,
+        draft.description,
+        draft.file_count,
+        draft.total_size,
+        draft.status,
+        draft.created_at,
+        draft.machine_name,
+        draft.local_path,
+        draft.error_message,
+        draft.progress
+    )
+
 class DraftService:
     """服务类，用于管理剪映专业版草稿箱"""
     
@@ -32,13 +200,34 @@ class DraftService:
         self._initialized = True
         self.logger = logging.getLogger(__name__)
         
-        # 服务依赖
-        self.db_pool = DatabasePool()
-        self.api_service = APIService()
-        self.download_service = DownloadService()
+        # 服务依赖在首次使用时创建，见下方属性
+        self._deps_lock = threading.Lock()
+        
+        # 按UUID缓存草稿箱，写入或删除时失效
+        self._draft_cache = OrderedDict()  # uuid -> (时间戳, DraftModel)
+        self._missing_drafts = {}  # uuid -> 过期时间
+        self._draft_cache_lock = threading.Lock()
         
         self.logger.info("草稿箱服务初始化完成")
         
+    @cached_property
+    def db_pool(self) -> DatabasePool:
+        """数据库连接池，首次访问时创建（会建立数据库连接）"""
+        with self._deps_lock:
+            return DatabasePool()
+            
+    @cached_property
+    def api_service(self) -> APIService:
+        """API服务，首次访问时创建"""
+        with self._deps_lock:
+            return APIService()
+            
+    @cached_property
+    def download_service(self) -> DownloadService:
+        """下载服务，首次访问时创建"""
+        with self._deps_lock:
+            return DownloadService()
+            
     def get_draft_by_uuid(self, uuid: str) -> Optional[DraftModel]:
         """
         通过UUID获取草稿箱
@@ -49,27 +238,128 @@ class DraftService:
         Returns:
             DraftModel: 草稿箱模型，如果未找到则返回None
         """
+        draft = self._get_cached_draft(uuid)
+        if draft:
+            return draft
+            
+        if self._is_missing(uuid):
+            return None
+            
         try:
             # 首先尝试从本地数据库获取
-            query = "SELECT * FROM drafts WHERE uuid = %s"
-            results = self.db_pool.execute_query(query, (uuid,))
+            results = self.db_pool.execute_prepared(_SQL_GET_BY_UUID, (uuid,))
             
             if results and len(results) > 0:
-                return DraftModel.from_dict(results[0])
-                
-            # 如果本地没有，则从API获取
-            draft_data = self.api_service.get_draft_by_uuid(uuid)
-            
-            if draft_data:
-                return DraftModel.from_dict(draft_data)
+                draft = DraftModel.from_dict(results[0])
+            else:
+                # 如果本地没有，则从API获取，404视为不存在
+                try:
+                    draft_data = self.api_service.get_draft_by_uuid(uuid)
+                except HTTPError as e:
+                    if e.response is None or e.response.status_code != 404:
+                        raise
+                    draft_data = None
+                    
+                if not draft_data:
+                    self._mark_missing(uuid)
+                    return None
+                draft = DraftModel.from_dict(draft_data)
                 
-            return None
+            self._cache_draft(draft)
+            return draft
             
         except Exception as e:
             self.logger.error("获取草稿箱失败: %s", e)
             return None
             
-    def get_drafts(self, page: int = 1, page_size: int = 20, status: str = None) -> List[DraftModel]:
+    def _is_missing(self, uuid: str) -> bool:
+        """
+        检查UUID是否最近确认过不存在
+        
+        Args:
+            uuid (str): 草稿箱UUID
+            
+        Returns:
+            bool: 是否在不存在缓存中且未过期
+        """
+        with self._draft_cache_lock:
+            expires = self._missing_drafts.get(uuid)
+            if expires is None:
+                return False
+                
+            if time.monotonic() > expires:
+                del self._missing_drafts[uuid]
+                return False
+                
+            return True
+            
+    def _mark_missing(self, uuid: str):
+        """
+        记录UUID不存在
+        
+        Args:
+            uuid (str): 草稿箱UUID
+        """
+        with self._draft_cache_lock:
+            self._missing_drafts[uuid] = time.monotonic() + DRAFT_MISS_TTL
+            
+            # 只保留最近的记录，避免扫描大量无效UUID时无限增长
+            if len(self._missing_drafts) > DRAFT_CACHE_SIZE:
+                del self._missing_drafts[next(iter(self._missing_drafts))]
+            
+    def _get_cached_draft(self, uuid: str) -> Optional[DraftModel]:
+        """
+        从缓存获取草稿箱
+        
+        Args:
+            uuid (str): 草稿箱UUID
+            
+        Returns:
+            DraftModel: 草稿箱副本，未缓存或已过期则返回None
+        """
+        with self._draft_cache_lock:
+            entry = self._draft_cache.get(uuid)
+            if entry is None:
+                return None
+                
+            cached_at, draft = entry
+            if time.monotonic() - cached_at > DRAFT_CACHE_TTL:
+                del self._draft_cache[uuid]
+                return None
+                
+            self._draft_cache.move_to_end(uuid)
+            
+        # 返回副本，调用方修改模型不会影响缓存
+        return copy.copy(draft)
+        
+    def _cache_draft(self, draft: DraftModel):
+        """
+        缓存草稿箱
+        
+        Args:
+            draft (DraftModel): 草稿箱模型
+        """
+        with self._draft_cache_lock:
+            self._missing_drafts.pop(draft.uuid, None)
+            self._draft_cache[draft.uuid] = (time.monotonic(), copy.copy(draft))
+            self._draft_cache.move_to_end(draft.uuid)
+            
+            if len(self._draft_cache) > DRAFT_CACHE_SIZE:
+                self._draft_cache.popitem(last=False)
+                
+    def _invalidate_draft(self, uuid: str):
+        """
+        使缓存中的草稿箱失效
+        
+        Args:
+            uuid (str): 草稿箱UUID
+        """
+        with self._draft_cache_lock:
+            self._draft_cache.pop(uuid, None)
+            self._missing_drafts.pop(uuid, None)
+            
+    def get_drafts(self, page: int = 1, page_size: int = 20, status: str = None,
+                   after: Optional[Tuple[datetime, int]] = None) -> List[DraftModel]:
         """
         获取草稿箱列表
         
@@ -77,28 +367,25 @@ class DraftService:
             page (int, optional): 页码
             page_size (int, optional): 每页数量
             status (str, optional): 按状态筛选
+            after (tuple, optional): 上一页最后一条的(updated_at, id)；
+                指定时忽略page，从该位置之后继续获取
             
         Returns:
             List[DraftModel]: 草稿箱列表
         """
         try:
-            query = "SELECT * FROM drafts"
-            params = []
-            
-            if status:
-                query += " WHERE status = %s"
-                params.append(status)
-                
-            query += " ORDER BY updated_at DESC LIMIT %s OFFSET %s"
-            params.extend([page_size, (page - 1) * page_size])
-            
-            results = self.db_pool.execute_query(query, tuple(params))
+            offset = (page - 1) * page_size
+            
+            if after and status:
+                results = self.db_pool.execute_prepared(_SQL_LIST_BY_STATUS_AFTER, (status, *_keyset_params(after), page_size), as_dict=False)
+            elif after:
+                results = self.db_pool.execute_prepared(_SQL_LIST_AFTER, (*_keyset_params(after), page_size), as_dict=False)
+            elif status:
+                results = self.db_pool.execute_prepared(_SQL_LIST_BY_STATUS, (status, page_size, offset), as_dict=False)
+            else:
+                results = self.db_pool.execute_prepared(_SQL_LIST, (page_size, offset), as_dict=False)
             
-            drafts = []
-            for row in results:
-                drafts.append(DraftModel.from_dict(row))
-                
-            return drafts
+            return DraftModel.from_rows(results)
             
         except Exception as e:
             self.logger.error("获取草稿箱列表失败: %s", e)
@@ -164,7 +451,15 @@ class DraftService:
             bool: 操作是否成功
         """
         try:
-            # 获取草稿箱
+            # 只更新状态相关字段，不必先读取整个草稿箱
+            params = (status, progress, error_message or None, uuid)
+            
+            if self.db_pool.execute_prepared(_SQL_UPDATE_STATUS, params, fetch=False):
+                self._invalidate_draft(uuid)
+                self.api_service.queue_draft_status(uuid, status, progress, error_message)
+                return True
+                
+            # 本地没有该草稿箱（连接启用了FOUND_ROWS，未变化的行也计入），按原流程获取后保存
             draft = self.get_draft_by_uuid(uuid)
             
             if not draft:
@@ -198,70 +493,12 @@ class DraftService:
             bool: 操作是否成功
         """
         try:
-            # 更新时间
-            draft.updated_at = datetime.now()
-            
-            # 检查草稿箱是否存在
-            query = "SELECT id FROM drafts WHERE uuid = %s"
-            results = self.db_pool.execute_query(query, (draft.uuid,))
-            
-            if results and len(results) > 0:
-                # 更新现有草稿箱
-                query = """
-                    UPDATE drafts SET
-                    name = %s,
-                    description = %s,
-                    file_count = %s,
-                    total_size = %s,
-                    status = %s,
-                    updated_at = %s,
-                    machine_name = %s,
-                    local_path = %s,
-                    error_message = %s,
-                    progress = %s
-                    WHERE uuid = %s
-                """
-                params = (
-                    draft.name,
-                    draft.description,
-                    draft.file_count,
-                    draft.total_size,
-                    draft.status,
-                    draft.updated_at,
-                    draft.machine_name,
-                    draft.local_path,
-                    draft.error_message,
-                    draft.progress,
-                    draft.uuid
-                )
-            else:
-                # 插入新草稿箱
-                query = """
-                    INSERT INTO drafts (
-                    uuid, name, description, file_count, total_size,
-                    status, created_at, updated_at, machine_name,
-                    local_path, error_message, progress
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """
-                params = (
-                    draft.uuid,
-                    draft.name,
-                    draft.description,
-                    draft.file_count,
-                    draft.total_size,
-                    draft.status,
-                    draft.created_at,
-                    draft.updated_at,
-                    draft.machine_name,
-                    draft.local_path,
-                    draft.error_message,
-                    draft.progress
-                )
-                
-            self.db_pool.execute_query(query, params, fetch=False)
+            # 插入或更新草稿箱，一次往返完成；状态更新会频繁执行，使用预处理语句
+            self.db_pool.execute_prepared(_SQL_UPSERT, _upsert_params(draft), fetch=False)
+            self._invalidate_draft(draft.uuid)
             
-            # 同时更新API服务器上的状态
-            self.api_service.update_draft_status(
+            # 同时更新API服务器上的状态（后台合并发送，不阻塞下载）
+            self.api_service.queue_draft_status(
                 draft.uuid,
                 draft.status,
                 draft.progress,
@@ -293,24 +530,34 @@ class DraftService:
                 self.logger.error("未找到草稿箱: %s", uuid)
                 return False
                 
-            # 如果需要，删除本地文件
-            if delete_files and draft.local_path and os.path.exists(draft.local_path):
-                try:
-                    import shutil
-                    shutil.rmtree(draft.local_path)
-                except Exception as e:
-                    self.logger.error("删除本地文件失败: %s", e)
-                    
             # 从数据库中删除
-            query = "DELETE FROM drafts WHERE uuid = %s"
-            self.db_pool.execute_query(query, (uuid,), fetch=False)
+            self.db_pool.execute_prepared(_SQL_DELETE, (uuid,), fetch=False)
+            self._invalidate_draft(uuid)
             
+            # 如果需要，在后台删除本地文件，不等待完成
+            if delete_files and draft.local_path:
+                future = _delete_pool.submit(shutil.rmtree, draft.local_path)
+                future.add_done_callback(lambda f, path=draft.local_path: self._on_files_deleted(f, path))
+                
             return True
             
         except Exception as e:
             self.logger.error("删除草稿箱失败: %s", e)
             return False
             
+    def _on_files_deleted(self, future, path: str):
+        """
+        后台删除本地文件完成回调
+        
+        Args:
+            future (Future): 删除任务
+            path (str): 本地文件夹路径
+        """
+        error = future.exception()
+        # 文件夹本就不存在时无需处理
+        if error and not isinstance(error, FileNotFoundError):
+            self.logger.error("删除本地文件失败: %s: %s", path, error)
+            
     def count_drafts(self, status: str = None) -> int:
         """
         统计草稿箱数量
@@ -322,14 +569,10 @@ class DraftService:
             int: 草稿箱数量
         """
         try:
-            query = "SELECT COUNT(*) as count FROM drafts"
-            params = []
-            
             if status:
-                query += " WHERE status = %s"
-                params.append(status)
-                
-            results = self.db_pool.execute_query(query, tuple(params) if params else None)
+                results = self.db_pool.execute_prepared(_SQL_COUNT_BY_STATUS, (status,))
+            else:
+                results = self.db_pool.execute_prepared(_SQL_COUNT)
             
             if results and len(results) > 0:
                 return results[0]['count']
@@ -340,36 +583,77 @@ class DraftService:
             self.logger.error("统计草稿箱数量失败: %s", e)
             return 0
             
-    def search_drafts(self, keyword: str, page: int = 1, page_size: int = 20) -> List[DraftModel]:
+    def list_drafts_with_total(self, page: int = 1, page_size: int = 20,
+                               status: str = None) -> Tuple[List[DraftModel], int]:
         """
-        搜索草稿箱
+        获取草稿箱列表及总数
         
         Args:
-            keyword (str): 搜索关键词
             page (int, optional): 页码
             page_size (int, optional): 每页数量
+            status (str, optional): 按状态筛选
             
         Returns:
-            List[DraftModel]: 草稿箱列表
+            tuple: (草稿箱列表, 草稿箱总数)
         """
         try:
-            query = """
-                SELECT * FROM drafts
-                WHERE name LIKE %s OR description LIKE %s OR uuid LIKE %s
-                ORDER BY updated_at DESC
-                LIMIT %s OFFSET %s
-            """
+            offset = (page - 1) * page_size
             
-            keyword_param = f"%{keyword}%"
-            params = (keyword_param, keyword_param, keyword_param, page_size, (page - 1) * page_size)
-            
-            results = self.db_pool.execute_query(query, params)
+            if status:
+                results = self.db_pool.execute_prepared(_SQL_LIST_BY_STATUS_WITH_TOTAL, (status, page_size, offset), as_dict=False)
+            else:
+                results = self.db_pool.execute_prepared(_SQL_LIST_WITH_TOTAL, (page_size, offset), as_dict=False)
             
-            drafts = []
-            for row in results:
-                drafts.append(DraftModel.from_dict(row))
+            if not results:
+                # 页码越界时窗口函数没有行可带出总数，单独统计
+                return [], self.count_drafts(status) if page > 1 else 0
                 
-            return drafts
+            # total是列表列之后的最后一列
+            return DraftModel.from_rows(results), results[0][-1]
+            
+        except Exception as e:
+            self.logger.error("获取草稿箱列表失败: %s", e)
+            return [], 0
+            
+    def search_drafts(self, keyword: str, page: int = 1, page_size: int = 20,
+                      after: Optional[Tuple[datetime, int]] = None) -> List[DraftModel]:
+        """
+        搜索草稿箱
+        
+        Args:
+            keyword (str): 搜索关键词
+            page (int, optional): 页码
+            page_size (int, optional): 每页数量
+            after (tuple, optional): 上一页最后一条的(updated_at, id)；
+                指定时忽略page，从该位置之后继续获取
+            
+        Returns:
+            List[DraftModel]: 草稿箱列表
+        """
+        try:
+            keyword = keyword.strip()
+            offset = (page - 1) * page_size
+            
+            if (len(keyword) < SEARCH_MIN_TOKEN or not _CJK_PATTERN.search(keyword)
+                    or not self.db_pool.fulltext_search):
+                keyword_param = f"%{_escape_like(keyword)}%"
+                if after:
+                    params = (keyword_param, keyword_param, keyword_param, *_keyset_params(after), page_size)
+                    results = self.db_pool.execute_prepared(_SQL_SEARCH_LIKE_AFTER, params, as_dict=False)
+                else:
+                    params = (keyword_param, keyword_param, keyword_param, page_size, offset)
+                    results = self.db_pool.execute_prepared(_SQL_SEARCH_LIKE, params, as_dict=False)
+            else:
+                # 整体作为短语匹配，避免关键词中的布尔运算符被解释
+                phrase = '"%s"' % keyword.replace('"', ' ')
+                if after:
+                    params = (phrase, *_keyset_params(after), page_size)
+                    results = self.db_pool.execute_prepared(_SQL_SEARCH_AFTER, params, as_dict=False)
+                else:
+                    params = (phrase, page_size, offset)
+                    results = self.db_pool.execute_prepared(_SQL_SEARCH, params, as_dict=False)
+            
+            return DraftModel.from_rows(results)
             
         except Exception as e:
             self.logger.error("搜索草稿箱失败: %s", e)
@@ -17,6 +17,15 @@ directories = [
     "resources/sounds"
 ]
 
+# Every directory and each of its parents gets an __init__.py; collect them
+# once so shared parents such as "ui" and "resources" are only visited once
+package_dirs = {}
+for directory in directories:
+    current_path = ""
+    for part in directory.split("/"):
+        current_path = os.path.join(current_path, part)
+        package_dirs[current_path] = None
+
 # Create directories
 for directory in directories:
     os.makedirs(directory, exist_ok=True)
@@ -24,25 +33,15 @@ for directory in directories:
 
 print("Directory structure setup complete!")
 
-# Create __init__.py files in each package directory
-for directory in directories:
-    if "/" in directory:
-        # Handle nested directories
-        parts = directory.split("/")
-        current_path = ""
-        for part in parts:
-            current_path = os.path.join(current_path, part)
-            init_file = os.path.join(current_path, "__init__.py")
-            if not os.path.exists(init_file):
-                with open(init_file, "w") as f:
-                    f.write("# Package initialization\n")
-                print(f"Created: {init_file}")
-    else:
-        # Handle top-level directories
-        init_file = os.path.join(directory, "__init__.py")
-        if not os.path.exists(init_file):
-            with open(init_file, "w") as f:
-                f.write("# Package initialization\n")
-            print(f"Created: {init_file}")
+# Create __init__.py files in each package directory; opening with "x"
+# creates the file only if it does not exist, without a separate stat
+for package_dir in package_dirs:
+    init_file = os.path.join(package_dir, "__init__.py")
+    try:
+        with open(init_file, "x") as f:
+            f.write("# Package initialization\n")
+    except FileExistsError:
+        continue
+    print(f"Created: {init_file}")
 
-print("Package initialization files created!") 
\ No newline at end of file
+print("Package initialization files created!")
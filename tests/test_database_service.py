@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import pytest
+
+mysql_connector = pytest.importorskip("mysql.connector")
+pytest.importorskip("dotenv")
+
+from services.database_service import DatabasePool
+
+
+class FakeConnection:
+    """Connection that persists statements the way an autocommit MySQL session does"""
+
+    def __init__(self, fail_on=None):
+        self.fail_on = fail_on
+        self.executed = 0
+        self.persisted = []
+        self.pending = None  # statements of the open transaction, if any
+
+    def start_transaction(self):
+        self.pending = []
+
+    def commit(self):
+        self.persisted.extend(self.pending or [])
+        self.pending = None
+
+    def rollback(self):
+        self.pending = None
+
+    def cursor(self, prepared=False):
+        return FakeCursor(self)
+
+    def close(self):
+        pass
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, query, params=None):
+        connection = self.connection
+        connection.executed += 1
+        if connection.executed == connection.fail_on:
+            raise mysql_connector.Error("boom")
+
+        if connection.pending is None:
+            # Outside a transaction every statement commits on its own
+            connection.persisted.append(params)
+        else:
+            connection.pending.append(params)
+
+    def close(self):
+        pass
+
+
+def make_pool(connection):
+    pool = object.__new__(DatabasePool)
+    pool.logger = logging.getLogger(__name__)
+
+    @contextmanager
+    def borrow():
+        yield connection
+
+    pool.connection = borrow
+    return pool
+
+
+def test_execute_many_rolls_back_earlier_chunks_on_failure():
+    connection = FakeConnection(fail_on=2)
+    pool = make_pool(connection)
+    rows = [(i, f"name{i}") for i in range(5)]
+
+    with pytest.raises(mysql_connector.Error):
+        pool.execute_many("INSERT INTO t (a, b) VALUES (%s, %s)", rows, batch_size=2)
+
+    assert connection.executed == 2
+    assert connection.persisted == []
+
+
+def test_execute_many_commits_all_chunks():
+    connection = FakeConnection()
+    pool = make_pool(connection)
+    rows = [(i, f"name{i}") for i in range(5)]
+
+    pool.execute_many("INSERT INTO t (a, b) VALUES (%s, %s)", rows, batch_size=2)
+
+    assert connection.executed == 3
+    assert len(connection.persisted) == 3
+
+
+class StalePreparedCursor:
+    """Prepared cursor whose statement handle died with a reconnect"""
+
+    def execute(self, query, params=None):
+        raise mysql_connector.Error("Unknown prepared statement handler", errno=1243)
+
+    def close(self):
+        pass
+
+
+class PreparedCursor:
+    rowcount = 1
+
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, query, params=None):
+        self.connection.executed += 1
+
+    def close(self):
+        pass
+
+
+def test_execute_prepared_reprepares_after_reconnect():
+    connection = FakeConnection()
+    connection.cursor = lambda prepared=False: PreparedCursor(connection)
+    query = "UPDATE t SET a = %s WHERE b = %s"
+    connection.prepared_cursors = OrderedDict([
+        (query, StalePreparedCursor()),
+        ("SELECT 1", StalePreparedCursor()),
+    ])
+    pool = make_pool(connection)
+
+    assert pool.execute_prepared(query, (1, 2), fetch=False) == 1
+    assert connection.executed == 1
+    assert list(connection.prepared_cursors) == [query]
+    assert isinstance(connection.prepared_cursors[query], PreparedCursor)
+
+
+def test_eagerly_fill_pool_closes_opened_connections_on_failure(monkeypatch):
+    opened = []
+    attempts = iter(range(4))
+
+    def connect(**config):
+        if next(attempts) == 2:
+            raise mysql_connector.Error("connection refused")
+        connection = FakeConnection()
+        connection.closed = False
+        connection.close = lambda: setattr(connection, 'closed', True)
+        opened.append(connection)
+        return connection
+
+    monkeypatch.setattr(mysql_connector, "connect", connect)
+    pool = make_pool(None)
+    pool.db_config = {'pool_name': 'test', 'pool_size': 4, 'host': 'localhost'}
+    pool.pool = None
+
+    with pytest.raises(mysql_connector.Error):
+        pool._eagerly_fill_pool()
+
+    assert len(opened) == 3
+    assert all(connection.closed for connection in opened)
+
+
+class SchemaCursor:
+    """Cursor with the execute signature of current mysql-connector releases"""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, operation, params=None, map_results=False):
+        self.statements.append(" ".join(operation.split()))
+
+    def fetchall(self):
+        return [("PRIMARY",), ("idx_updated_at",)]
+
+    def close(self):
+        pass
+
+
+def test_initialize_schema_runs_each_statement_on_one_cursor():
+    cursor = SchemaCursor()
+    connection = FakeConnection()
+    connection.cursor = lambda prepared=False: cursor
+    pool = make_pool(connection)
+
+    pool._initialize_schema()
+
+    created = [statement for statement in cursor.statements if statement.startswith("CREATE TABLE")]
+    assert [statement.split()[5] for statement in created] == ["drafts", "draft_files", "download_tasks"]
+    altered = [statement for statement in cursor.statements if statement.startswith("ALTER TABLE")]
+    assert len(altered) == 2
+    assert not any("idx_updated_at (" in statement for statement in altered)
+
+
+class NoNgramCursor(SchemaCursor):
+    """Cursor of a server without the ngram full-text parser, such as MariaDB"""
+
+    def execute(self, operation, params=None, map_results=False):
+        if "WITH PARSER ngram" in operation:
+            raise mysql_connector.Error("Function 'ngram' is not defined", errno=1128)
+        super().execute(operation, params, map_results)
+
+
+def test_initialize_schema_without_ngram_parser_disables_fulltext_search():
+    cursor = NoNgramCursor()
+    connection = FakeConnection()
+    connection.cursor = lambda prepared=False: cursor
+    pool = make_pool(connection)
+
+    pool._initialize_schema()
+
+    assert pool.fulltext_search is False
+    assert not any("ngram" in statement for statement in cursor.statements)
+    assert any("idx_status_updated_at" in statement for statement in cursor.statements)
+
+
+def test_initialize_schema_enables_fulltext_search():
+    cursor = SchemaCursor()
+    connection = FakeConnection()
+    connection.cursor = lambda prepared=False: cursor
+    pool = make_pool(connection)
+
+    pool._initialize_schema()
+
+    assert pool.fulltext_search is True
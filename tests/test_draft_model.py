@@ -0,0 +1,22 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from decimal import Decimal
+
+import pytest
+
+from models.draft_model import DraftModel
+
+
+@pytest.mark.parametrize("total_size, expected", [
+    (0, "0 B"),
+    (None, "0 B"),
+    (512, "512 B"),
+    (2048, "2.0 KB"),
+    (1.5e6, "1.4 MB"),
+    (Decimal(3 * 1024 ** 3), "3.00 GB"),
+])
+def test_get_formatted_size_accepts_api_and_database_types(total_size, expected):
+    draft = DraftModel.from_dict({'uuid': 'u', 'name': 'n', 'total_size': total_size})
+
+    assert draft.get_formatted_size() == expected
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+
+pytest.importorskip("mysql.connector")
+pytest.importorskip("dotenv")
+pytest.importorskip("requests")
+pytest.importorskip("PyQt6")
+
+from services import draft_service
+from services.draft_service import DraftService
+
+
+class FakePool:
+    """Records prepared queries instead of running them"""
+
+    def __init__(self, fulltext_search=True):
+        self.fulltext_search = fulltext_search
+        self.calls = []
+
+    def execute_prepared(self, query, params=None, fetch=True, as_dict=True):
+        self.calls.append((query, params))
+        # Writes report one matched row
+        return [] if fetch else 1
+
+
+class FakeAPIService:
+    def __init__(self):
+        self.queued = []
+
+    def queue_draft_status(self, *args):
+        self.queued.append(args)
+
+
+@pytest.fixture
+def service():
+    service = DraftService()
+    pool = FakePool()
+    # Shadow the lazily created pool on this instance
+    service.__dict__['db_pool'] = pool
+    service.__dict__['api_service'] = FakeAPIService()
+    yield service
+    del service.__dict__['db_pool']
+    del service.__dict__['api_service']
+
+
+@pytest.mark.parametrize("keyword", ["data", "trip", "a1b2"])
+def test_search_ascii_name_uses_substring_match(service, keyword):
+    service.search_drafts(keyword)
+
+    query, params = service.db_pool.calls[-1]
+    assert query is draft_service._SQL_SEARCH_LIKE
+    assert params[:3] == (f"%{keyword}%",) * 3
+
+
+def test_search_cjk_name_uses_fulltext_index(service):
+    service.search_drafts("旅行 vlog")
+
+    query, params = service.db_pool.calls[-1]
+    assert query is draft_service._SQL_SEARCH
+    assert params[0] == '"旅行 vlog"'
+
+
+def test_search_cjk_name_without_fulltext_index_uses_substring_match(service):
+    service.db_pool.fulltext_search = False
+
+    service.search_drafts("旅行")
+
+    query, params = service.db_pool.calls[-1]
+    assert query is draft_service._SQL_SEARCH_LIKE
+    assert params[0] == "%旅行%"
+
+
+def test_update_draft_status_takes_updated_at_from_database_clock(service):
+    assert service.update_draft_status("uuid-1", "downloading", 40)
+
+    query, params = service.db_pool.calls[-1]
+    assert query is draft_service._SQL_UPDATE_STATUS
+    assert "updated_at = NOW()" in query
+    assert params == ("downloading", 40, None, "uuid-1")
+    assert service.api_service.queued == [("uuid-1", "downloading", 40, None)]
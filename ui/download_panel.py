@@ -2,14 +2,16 @@
 # -*- coding: utf-8 -*-
 
 import os
+import time
 import logging
+import threading
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QFileDialog, QTableWidget, QTableWidgetItem, QHeaderView,
     QAbstractItemView
 )
-from PyQt6.QtCore import Qt, pyqtSlot, QThread, pyqtSignal
-from PyQt6.QtGui import QIcon, QFont
+from PyQt6.QtCore import Qt, pyqtSlot, pyqtSignal, QObject, QRunnable, QThreadPool, QUrl
+from PyQt6.QtGui import QIcon, QFont, QDesktopServices
 
 from qfluentwidgets import (
     LineEdit, PushButton, ProgressBar, ComboBox, 
@@ -18,59 +20,93 @@ from qfluentwidgets import (
     InfoBar, InfoBarPosition, TableWidget
 )
 
+from config.settings import get_int_setting
 from models.draft_model import DraftModel
 from services.draft_service import DraftService
 from services.api_service import APIService
 from utils.file_utils import ensure_dir, get_free_space
 
-class DownloadWorker(QThread):
-    """Worker thread for downloading drafts"""
+logger = logging.getLogger(__name__)
+
+# Minimum time between progress signals from a download worker
+PROGRESS_EMIT_INTERVAL_NS = 100_000_000
+
+# Draft progress is persisted every this many percent
+PROGRESS_PERSIST_STEP = 10
+
+# Progress step (percent) and tick interval (seconds) of the simulated download
+SIMULATED_STEP = 5
+SIMULATED_TICK = 0.25
+
+# Initial value of the save path field
+_DEFAULT_SAVE_PATH = os.path.expanduser("~/Downloads")
+
+# InfoBar title for each message type of DownloadPanel.show_message
+_MESSAGE_TITLES = {
+    'info': "信息",
+    'success': "成功",
+    'warning': "警告",
+    'error': "错误"
+}
+
+class DownloadWorkerSignals(QObject):
+    """Signals for DownloadWorker, which as a QRunnable cannot define its own"""
     
-    # Signals
     started = pyqtSignal(str)  # draft_uuid
     progress = pyqtSignal(str, int)  # draft_uuid, progress
     completed = pyqtSignal(str)  # draft_uuid
     failed = pyqtSignal(str, str)  # draft_uuid, error_message
+    canceled = pyqtSignal(str)  # draft_uuid
+
+class DownloadWorker(QRunnable):
+    """Runnable for downloading drafts on the panel's thread pool"""
     
-    def __init__(self, draft_uuid, save_path, parent=None):
+    def __init__(self, draft_uuid, save_path, draft_service=None, api_service=None):
         """
         Initialize the download worker
         
         Args:
             draft_uuid (str): Draft UUID
             save_path (str): Path to save the draft
-            parent (QObject, optional): Parent object
+            draft_service (DraftService, optional): Shared draft service
+            api_service (APIService, optional): Shared API service
         """
-        super().__init__(parent)
+        super().__init__()
         
+        self.signals = DownloadWorkerSignals()
         self.draft_uuid = draft_uuid
         self.save_path = save_path
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         
-        # Services
-        self.draft_service = DraftService()
-        self.api_service = APIService()
+        # Services, normally handed over by the panel
+        self.draft_service = draft_service or DraftService()
+        self.api_service = api_service or APIService()
         
-        # Flag to control thread execution
-        self.is_running = True
+        # Set to stop the download
+        self._stop_event = threading.Event()
         
     def run(self):
         """Run the download process"""
+        # Cancelled while still waiting in the pool queue
+        if self._stop_event.is_set():
+            self.signals.canceled.emit(self.draft_uuid)
+            return
+            
         try:
             # Emit started signal
-            self.started.emit(self.draft_uuid)
+            self.signals.started.emit(self.draft_uuid)
             
             # Get draft details
             draft = self.draft_service.get_draft_by_uuid(self.draft_uuid)
             
             if not draft:
-                self.failed.emit(self.draft_uuid, "Draft not found")
+                self.signals.failed.emit(self.draft_uuid, "Draft not found")
                 return
                 
             # Create save directory
             draft_dir = os.path.join(self.save_path, draft.name)
             if not ensure_dir(draft_dir):
-                self.failed.emit(self.draft_uuid, f"Failed to create directory: {draft_dir}")
+                self.signals.failed.emit(self.draft_uuid, f"Failed to create directory: {draft_dir}")
                 return
                 
             # Update draft status to downloading
@@ -80,51 +116,49 @@ class DownloadWorker(QThread):
             files = self.draft_service.get_draft_files(self.draft_uuid)
             
             if not files:
-                self.failed.emit(self.draft_uuid, "No files found in draft")
-                return
-                
-            # Check disk space
-            total_size = sum(file.get('size', 0) for file in files)
-            free_space = get_free_space(draft_dir)
-            
-            if total_size > free_space:
-                self.failed.emit(
-                    self.draft_uuid,
-                    f"Not enough disk space. Required: {total_size}, Available: {free_space}"
-                )
+                self.signals.failed.emit(self.draft_uuid, "No files found in draft")
                 return
                 
-            # TODO: Implement actual download logic using DownloadService
+            # TODO: Implement actual download logic using DownloadService, which
+            # already writes files through a WRITE_BUFFER_BYTES buffer
             # For now, just simulate progress
-            for i in range(101):
-                if not self.is_running:
+            last_emit_ns = 0
+            for i in range(0, 101, SIMULATED_STEP):
+                if self._stop_event.is_set():
+                    self.signals.canceled.emit(self.draft_uuid)
                     return
                     
-                # Update progress
-                self.progress.emit(self.draft_uuid, i)
-                
-                # Update draft status
-                self.draft_service.update_draft_status(self.draft_uuid, "downloading", i)
-                
-                # Sleep to simulate download
-                self.msleep(50)
+                # Update progress, at most once per interval (always at 100%)
+                now = time.monotonic_ns()
+                if i == 100 or now - last_emit_ns >= PROGRESS_EMIT_INTERVAL_NS:
+                    self.signals.progress.emit(self.draft_uuid, i)
+                    last_emit_ns = now
+                    
+                # Update draft status in coarser steps
+                if i % PROGRESS_PERSIST_STEP == 0:
+                    self.draft_service.update_draft_status(self.draft_uuid, "downloading", i)
+                    
+                # Sleep to simulate download; wakes up early when stopped
+                if self._stop_event.wait(SIMULATED_TICK):
+                    self.signals.canceled.emit(self.draft_uuid)
+                    return
                 
             # Mark as completed
             self.draft_service.update_draft_status(self.draft_uuid, "completed", 100)
             
             # Emit completed signal
-            self.completed.emit(self.draft_uuid)
+            self.signals.completed.emit(self.draft_uuid)
             
         except Exception as e:
             self.logger.error("Download failed: %s", e)
-            self.failed.emit(self.draft_uuid, str(e))
+            self.signals.failed.emit(self.draft_uuid, str(e))
             
             # Update draft status to failed
             self.draft_service.update_draft_status(self.draft_uuid, "failed", 0, str(e))
             
     def stop(self):
         """Stop the download process"""
-        self.is_running = False
+        self._stop_event.set()
 
 class DownloadPanel(QWidget):
     """Panel for downloading drafts"""
@@ -133,7 +167,7 @@ class DownloadPanel(QWidget):
         """Initialize the download panel"""
         super().__init__(parent)
         
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.parent = parent
         
         # Services
@@ -143,6 +177,14 @@ class DownloadPanel(QWidget):
         # Download workers
         self.download_workers = {}  # draft_uuid -> DownloadWorker
         
+        # Downloads run on a bounded pool instead of a thread each
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(get_int_setting('DOWNLOAD_CONCURRENT_COUNT', 5))
+        
+        # Table lookups, so signal handlers don't scan the table
+        self.row_by_uuid = {}  # draft_uuid -> row
+        self.widgets_by_uuid = {}  # draft_uuid -> (progress_bar, cancel_button, open_button, retry_button)
+        
         # Set up UI
         self.setup_ui()
         
@@ -188,7 +230,7 @@ class DownloadPanel(QWidget):
         
         self.save_path_input = LineEdit(input_card)
         self.save_path_input.setPlaceholderText("选择保存路径")
-        self.save_path_input.setText(os.path.expanduser("~/Downloads"))
+        self.save_path_input.setText(_DEFAULT_SAVE_PATH)
         save_path_layout.addWidget(self.save_path_input)
         
         self.browse_button = PushButton("浏览...", input_card)
@@ -230,10 +272,10 @@ class DownloadPanel(QWidget):
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        # Fixed widths, so adding a row doesn't rescan every row to size the columns
+        for column, width in ((1, 90), (2, 180), (3, 280)):
+            self.table.horizontalHeader().setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
+            self.table.horizontalHeader().resizeSection(column, width)
         self.table.verticalHeader().setVisible(False)
         self.table.setColumnHidden(4, True)  # Hide UUID column
         
@@ -267,14 +309,13 @@ class DownloadPanel(QWidget):
             self.show_message("请选择保存路径", "warning")
             return
             
-        # Check if save path exists
-        if not os.path.exists(save_path):
-            try:
-                os.makedirs(save_path)
-            except Exception as e:
-                self.show_message(f"无法创建保存路径: {e}", "error")
-                return
-                
+        # Create save path if needed
+        try:
+            os.makedirs(save_path, exist_ok=True)
+        except OSError as e:
+            self.show_message(f"无法创建保存路径: {e}", "error")
+            return
+            
         try:
             # Get draft details
             draft = self.draft_service.get_draft_by_uuid(uuid)
@@ -284,11 +325,14 @@ class DownloadPanel(QWidget):
                 return
                 
             # Check if draft is already in the table
-            for row in range(self.table.rowCount()):
-                if self.table.item(row, 4).text() == uuid:
-                    self.show_message("草稿箱已在下载列表中", "warning")
-                    return
-                    
+            if uuid in self.row_by_uuid:
+                self.show_message("草稿箱已在下载列表中", "warning")
+                return
+                
+            # Check disk space before adding the row or starting a worker
+            if not self.check_free_space(draft, save_path):
+                return
+                
             # Add draft to table
             self.add_draft_to_table(draft)
             
@@ -309,6 +353,20 @@ class DownloadPanel(QWidget):
         """
         Add draft to table
         
+        Args:
+            draft (DraftModel): Draft model
+        """
+        # Repaint once after the whole row is filled in
+        self.table.setUpdatesEnabled(False)
+        try:
+            self._fill_draft_row(draft)
+        finally:
+            self.table.setUpdatesEnabled(True)
+            
+    def _fill_draft_row(self, draft):
+        """
+        Insert and fill a table row for a draft
+        
         Args:
             draft (DraftModel): Draft model
         """
@@ -318,24 +376,19 @@ class DownloadPanel(QWidget):
         # Insert new row
         self.table.insertRow(row)
         
-        # Set draft name
+        # Set draft name; the item also keeps the model for the row's slots
         name_item = QTableWidgetItem(draft.name)
+        name_item.setData(Qt.ItemDataRole.UserRole, draft)
         self.table.setItem(row, 0, name_item)
         
         # Set status
         status_item = QTableWidgetItem(draft.get_status_display())
         self.table.setItem(row, 1, status_item)
         
-        # Create progress bar
-        progress_widget = QWidget()
-        progress_layout = QHBoxLayout(progress_widget)
-        progress_layout.setContentsMargins(5, 2, 5, 2)
-        
-        progress_bar = ProgressBar(progress_widget)
+        # Create progress bar; it is the cell widget itself, without a wrapper
+        progress_bar = ProgressBar()
         progress_bar.setValue(draft.progress)
-        progress_layout.addWidget(progress_bar)
-        
-        self.table.setCellWidget(row, 2, progress_widget)
+        self.table.setCellWidget(row, 2, progress_bar)
         
         # Create action buttons
         action_widget = QWidget()
@@ -343,20 +396,23 @@ class DownloadPanel(QWidget):
         action_layout.setContentsMargins(5, 2, 5, 2)
         action_layout.setSpacing(4)
         
+        # Bind only the UUID, so the buttons don't keep the whole model alive
+        uuid = draft.uuid
+        
         cancel_button = PushButton("取消", action_widget)
         cancel_button.setIcon(FluentIcon.CANCEL)
-        cancel_button.clicked.connect(lambda: self.cancel_download(draft.uuid))
+        cancel_button.clicked.connect(lambda: self.cancel_download(uuid))
         action_layout.addWidget(cancel_button)
         
         open_button = PushButton("打开", action_widget)
         open_button.setIcon(FluentIcon.FOLDER)
-        open_button.clicked.connect(lambda: self.open_draft(draft.uuid))
+        open_button.clicked.connect(lambda: self.open_draft(uuid))
         open_button.setEnabled(draft.status == "completed")
         action_layout.addWidget(open_button)
         
         retry_button = PushButton("重试", action_widget)
         retry_button.setIcon(FluentIcon.SYNC)
-        retry_button.clicked.connect(lambda: self.retry_download(draft.uuid))
+        retry_button.clicked.connect(lambda: self.retry_download(uuid))
         retry_button.setEnabled(draft.status == "failed")
         action_layout.addWidget(retry_button)
         
@@ -366,6 +422,32 @@ class DownloadPanel(QWidget):
         uuid_item = QTableWidgetItem(draft.uuid)
         self.table.setItem(row, 4, uuid_item)
         
+        # Index the row and its widgets
+        self.row_by_uuid[draft.uuid] = row
+        self.widgets_by_uuid[draft.uuid] = (progress_bar, cancel_button, open_button, retry_button)
+        
+    def check_free_space(self, draft, save_path):
+        """
+        Check that the save path has room for a draft
+        
+        Args:
+            draft (DraftModel): Draft model
+            save_path (str): Path to save the draft
+            
+        Returns:
+            bool: True if there is enough free space
+        """
+        free_space = get_free_space(save_path)
+        
+        if draft.total_size > free_space:
+            self.show_message(
+                f"磁盘空间不足，需要 {draft.total_size} 字节，可用 {free_space} 字节",
+                "error"
+            )
+            return False
+            
+        return True
+        
     def download_draft(self, draft, save_path):
         """
         Download a draft
@@ -375,19 +457,20 @@ class DownloadPanel(QWidget):
             save_path (str): Path to save the draft
         """
         # Create download worker
-        worker = DownloadWorker(draft.uuid, save_path, self)
+        worker = DownloadWorker(draft.uuid, save_path, self.draft_service, self.api_service)
         
         # Connect signals
-        worker.started.connect(self.on_download_started)
-        worker.progress.connect(self.on_download_progress)
-        worker.completed.connect(self.on_download_completed)
-        worker.failed.connect(self.on_download_failed)
+        worker.signals.started.connect(self.on_download_started)
+        worker.signals.progress.connect(self.on_download_progress)
+        worker.signals.completed.connect(self.on_download_completed)
+        worker.signals.failed.connect(self.on_download_failed)
+        worker.signals.canceled.connect(self.on_download_canceled)
         
         # Store worker
         self.download_workers[draft.uuid] = worker
         
-        # Start worker
-        worker.start()
+        # Queue worker on the pool
+        self.thread_pool.start(worker)
         
     def cancel_download(self, uuid):
         """
@@ -400,42 +483,41 @@ class DownloadPanel(QWidget):
         worker = self.download_workers.get(uuid)
         
         if worker:
-            # Stop worker
+            # Stop worker; it exits at its next check without blocking the UI
             worker.stop()
             
-            # Wait for worker to finish
-            worker.wait()
-            
-            # Remove worker
+            # Remove worker; the draft status is reset once it has stopped
             del self.download_workers[uuid]
             
-            # Update draft status
-            self.draft_service.update_draft_status(uuid, "pending", 0)
-            
             # Update table
-            for row in range(self.table.rowCount()):
-                if self.table.item(row, 4).text() == uuid:
-                    # Update status
-                    self.table.item(row, 1).setText("已取消")
-                    
-                    # Update progress bar
-                    progress_widget = self.table.cellWidget(row, 2)
-                    progress_bar = progress_widget.layout().itemAt(0).widget()
-                    progress_bar.setValue(0)
-                    
-                    # Update action buttons
-                    action_widget = self.table.cellWidget(row, 3)
-                    layout = action_widget.layout()
-                    
-                    # Enable retry button
-                    retry_button = layout.itemAt(2).widget()
-                    retry_button.setEnabled(True)
-                    
-                    break
-                    
+            row = self.row_by_uuid.get(uuid)
+            if row is not None:
+                progress_bar, _, _, retry_button = self.widgets_by_uuid[uuid]
+                
+                # Update status
+                self.table.item(row, 1).setText("已取消")
+                
+                # Update progress bar
+                progress_bar.setValue(0)
+                
+                # Enable retry button
+                retry_button.setEnabled(True)
+                
             # Show message
             self.show_message(f"已取消下载", "info")
             
+    @pyqtSlot(str)
+    def on_download_canceled(self, uuid):
+        """
+        Handle a cancelled worker having stopped
+        
+        Args:
+            uuid (str): Draft UUID
+        """
+        # A retry may already have started a new worker for the draft
+        if uuid not in self.download_workers:
+            self.draft_service.update_draft_status(uuid, "pending", 0)
+            
     @pyqtSlot(str)
     def on_download_started(self, uuid):
         """
@@ -445,12 +527,13 @@ class DownloadPanel(QWidget):
             uuid (str): Draft UUID
         """
         # Update table
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 4).text() == uuid:
-                # Update status
-                self.table.item(row, 1).setText("下载中")
-                break
-                
+        row = self.row_by_uuid.get(uuid)
+        if row is None:
+            return
+            
+        # Update status
+        self.table.item(row, 1).setText("下载中")
+        
     @pyqtSlot(str, int)
     def on_download_progress(self, uuid, progress):
         """
@@ -460,15 +543,11 @@ class DownloadPanel(QWidget):
             uuid (str): Draft UUID
             progress (int): Progress percentage
         """
-        # Update table
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 4).text() == uuid:
-                # Update progress bar
-                progress_widget = self.table.cellWidget(row, 2)
-                progress_bar = progress_widget.layout().itemAt(0).widget()
-                progress_bar.setValue(progress)
-                break
-                
+        # Update progress bar
+        widgets = self.widgets_by_uuid.get(uuid)
+        if widgets is not None:
+            widgets[0].setValue(progress)
+            
     @pyqtSlot(str)
     def on_download_completed(self, uuid):
         """
@@ -481,37 +560,26 @@ class DownloadPanel(QWidget):
         if uuid in self.download_workers:
             del self.download_workers[uuid]
             
-        # Get draft
-        draft = self.draft_service.get_draft_by_uuid(uuid)
-        
-        if not draft:
+        # Get draft from its row
+        row = self.row_by_uuid.get(uuid)
+        if row is None:
             return
             
-        # Update table
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 4).text() == uuid:
-                # Update status
-                self.table.item(row, 1).setText("已完成")
-                
-                # Update progress bar
-                progress_widget = self.table.cellWidget(row, 2)
-                progress_bar = progress_widget.layout().itemAt(0).widget()
-                progress_bar.setValue(100)
-                
-                # Update action buttons
-                action_widget = self.table.cellWidget(row, 3)
-                layout = action_widget.layout()
-                
-                # Enable open button
-                open_button = layout.itemAt(1).widget()
-                open_button.setEnabled(True)
-                
-                # Disable retry button
-                retry_button = layout.itemAt(2).widget()
-                retry_button.setEnabled(False)
-                
-                break
-                
+        draft = self.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+        progress_bar, _, open_button, retry_button = self.widgets_by_uuid[uuid]
+        
+        # Update status
+        self.table.item(row, 1).setText("已完成")
+        
+        # Update progress bar
+        progress_bar.setValue(100)
+        
+        # Enable open button
+        open_button.setEnabled(True)
+        
+        # Disable retry button
+        retry_button.setEnabled(False)
+        
         # Show message
         self.show_message(f"草稿箱 {draft.name} 下载完成", "success")
         
@@ -528,28 +596,19 @@ class DownloadPanel(QWidget):
         if uuid in self.download_workers:
             del self.download_workers[uuid]
             
-        # Get draft
-        draft = self.draft_service.get_draft_by_uuid(uuid)
-        
-        if not draft:
+        # Get draft from its row
+        row = self.row_by_uuid.get(uuid)
+        if row is None:
             return
             
-        # Update table
-        for row in range(self.table.rowCount()):
-            if self.table.item(row, 4).text() == uuid:
-                # Update status
-                self.table.item(row, 1).setText("失败")
-                
-                # Update action buttons
-                action_widget = self.table.cellWidget(row, 3)
-                layout = action_widget.layout()
-                
-                # Enable retry button
-                retry_button = layout.itemAt(2).widget()
-                retry_button.setEnabled(True)
-                
-                break
-                
+        draft = self.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+        
+        # Update status
+        self.table.item(row, 1).setText("失败")
+        
+        # Enable retry button
+        self.widgets_by_uuid[uuid][3].setEnabled(True)
+        
         # Show message
         self.show_message(f"草稿箱 {draft.name} 下载失败: {error_message}", "error")
         
@@ -560,7 +619,8 @@ class DownloadPanel(QWidget):
         Args:
             uuid (str): Draft UUID
         """
-        # Get draft
+        # Get draft; looked up again because local_path is only known once
+        # the download has started, after the row was created
         draft = self.draft_service.get_draft_by_uuid(uuid)
         
         if not draft or not draft.local_path:
@@ -572,17 +632,10 @@ class DownloadPanel(QWidget):
             self.show_message("草稿箱本地路径不存在", "error")
             return
             
-        try:
-            # Open folder
-            if os.name == 'nt':  # Windows
-                os.startfile(draft.local_path)
-            elif os.name == 'posix':  # macOS, Linux
-                import subprocess
-                subprocess.Popen(['xdg-open', draft.local_path])
-                
-        except Exception as e:
-            self.logger.error("Failed to open draft: %s", e)
-            self.show_message(f"无法打开草稿箱: {e}", "error")
+        # Open folder with the platform's file manager
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(draft.local_path)):
+            self.logger.error("Failed to open draft: %s", draft.local_path)
+            self.show_message("无法打开草稿箱", "error")
             
     def retry_download(self, uuid):
         """
@@ -591,13 +644,15 @@ class DownloadPanel(QWidget):
         Args:
             uuid (str): Draft UUID
         """
-        # Get draft
-        draft = self.draft_service.get_draft_by_uuid(uuid)
+        # Get draft from its row
+        row = self.row_by_uuid.get(uuid)
         
-        if not draft:
+        if row is None:
             self.show_message("找不到草稿箱", "error")
             return
             
+        draft = self.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+        
         # Get save path
         save_path = self.save_path_input.text().strip()
         
@@ -605,6 +660,10 @@ class DownloadPanel(QWidget):
             self.show_message("请选择保存路径", "warning")
             return
             
+        # Check disk space
+        if not self.check_free_space(draft, save_path):
+            return
+            
         # Start download
         self.download_draft(draft, save_path)
         
@@ -623,25 +682,9 @@ class DownloadPanel(QWidget):
             self.parent.show_message(message, message_type)
         else:
             # Create InfoBar if parent doesn't have show_message
-            icon = None
-            title = "信息"
-            
-            if message_type == "info":
-                title = "信息"
-                icon = FluentIcon.INFORMATION
-            elif message_type == "success":
-                title = "成功"
-                icon = FluentIcon.COMPLETED
-            elif message_type == "warning":
-                title = "警告"
-                icon = FluentIcon.WARNING
-            elif message_type == "error":
-                title = "错误" 
-                icon = FluentIcon.ERROR
-            
             # Show InfoBar directly
             InfoBar.success(
-                title=title,
+                title=_MESSAGE_TITLES.get(message_type, "信息"),
                 content=message,
                 orient=Qt.Orientation.Horizontal,
                 isClosable=True,
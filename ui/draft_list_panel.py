@@ -8,8 +8,8 @@ from PyQt6.QtWidgets import (
     QTableWidgetItem, QHeaderView, QAbstractItemView,
     QMenu, QDialog, QTextEdit, QDialogButtonBox
 )
-from PyQt6.QtCore import Qt, pyqtSlot, QThread, pyqtSignal, QTimer
-from PyQt6.QtGui import QIcon, QFont, QAction
+from PyQt6.QtCore import Qt, pyqtSlot, QThread, pyqtSignal, QTimer, QUrl
+from PyQt6.QtGui import QIcon, QFont, QAction, QDesktopServices
 
 from qfluentwidgets import (
     LineEdit, PushButton, ComboBox, CheckBox, SpinBox,
@@ -26,7 +26,7 @@ class DraftListWorker(QThread):
     """Worker thread for loading drafts"""
     
     # Signals
-    loaded = pyqtSignal(list)  # List of DraftModel
+    loaded = pyqtSignal(list, int)  # List of DraftModel, total count (-1 if unknown)
     failed = pyqtSignal(str)  # Error message
     
     def __init__(self, page=1, page_size=20, status=None, search_term=None, parent=None):
@@ -62,16 +62,17 @@ class DraftListWorker(QThread):
                     self.page,
                     self.page_size
                 )
+                total = -1
             else:
-                # Get drafts
-                drafts = self.draft_service.get_drafts(
+                # Get drafts together with the total count
+                drafts, total = self.draft_service.list_drafts_with_total(
                     self.page,
                     self.page_size,
                     self.status
                 )
                 
             # Emit loaded signal
-            self.loaded.emit(drafts)
+            self.loaded.emit(drafts, total)
             
         except Exception as e:
             self.logger.error("Failed to load drafts: %s", e)
@@ -382,12 +383,13 @@ class DraftListPanel(QWidget):
         self.current_page = 1
         self.load_drafts()
         
-    def on_drafts_loaded(self, drafts):
+    def on_drafts_loaded(self, drafts, total):
         """
         Handle drafts loaded
         
         Args:
             drafts (list): List of DraftModel objects
+            total (int): Total number of drafts, or -1 if unknown
         """
         # Clear table
         self.table.setRowCount(0)
@@ -397,7 +399,12 @@ class DraftListPanel(QWidget):
             self.add_draft_to_table(draft)
             
         # Update pagination
-        self.update_pagination()
+        if total < 0:
+            # Search results carry no total; allow paging on while pages are full
+            total = (self.current_page - 1) * self.page_size + len(drafts)
+            if len(drafts) == self.page_size:
+                total += 1
+        self.update_pagination(total)
         
         # Enable controls
         self.setEnabled(True)
@@ -469,29 +476,36 @@ class DraftListPanel(QWidget):
         action_layout.setContentsMargins(5, 2, 5, 2)
         action_layout.setSpacing(4)
         
+        # Bind only the UUID, so the buttons don't keep the whole model alive
+        uuid = draft.uuid
+        
         details_button = PushButton("详情", action_widget)
         details_button.setIcon(FluentIcon.INFO)
-        details_button.clicked.connect(lambda: self.show_draft_details_by_uuid(draft.uuid))
+        details_button.clicked.connect(lambda: self.show_draft_details_by_uuid(uuid))
         action_layout.addWidget(details_button)
         
         open_button = PushButton("打开", action_widget)
         open_button.setIcon(FluentIcon.FOLDER)
-        open_button.clicked.connect(lambda: self.open_draft_by_uuid(draft.uuid))
+        open_button.clicked.connect(lambda: self.open_draft_by_uuid(uuid))
         open_button.setEnabled(draft.status == "completed")
         action_layout.addWidget(open_button)
         
         delete_button = PushButton("删除", action_widget)
         delete_button.setIcon(FluentIcon.DELETE)
-        delete_button.clicked.connect(lambda: self.delete_draft(draft.uuid))
+        delete_button.clicked.connect(lambda: self.delete_draft(uuid))
         action_layout.addWidget(delete_button)
         
         self.table.setCellWidget(row, 6, action_widget)
         
-    def update_pagination(self):
-        """Update pagination controls"""
+    def update_pagination(self, total_drafts):
+        """
+        Update pagination controls
+        
+        Args:
+            total_drafts (int): Total number of drafts
+        """
         # Calculate total pages
-        total_drafts = self.draft_service.get_total_drafts_count()
-        self.total_pages = (total_drafts + self.page_size - 1) // self.page_size
+        self.total_pages = max(1, (total_drafts + self.page_size - 1) // self.page_size)
         
         # Update page label
         self.page_label.setText(f"第 {self.current_page} 页 / 共 {self.total_pages} 页")
@@ -579,17 +593,10 @@ class DraftListPanel(QWidget):
             self.show_message("草稿箱本地路径不存在", "error")
             return
             
-        try:
-            # Open folder
-            if os.name == 'nt':  # Windows
-                os.startfile(draft.local_path)
-            elif os.name == 'posix':  # macOS, Linux
-                import subprocess
-                subprocess.Popen(['xdg-open', draft.local_path])
-                
-        except Exception as e:
-            self.logger.error("Failed to open draft: %s", e)
-            self.show_message(f"无法打开草稿箱: {e}", "error")
+        # Open folder with the platform's file manager
+        if not QDesktopServices.openUrl(QUrl.fromLocalFile(draft.local_path)):
+            self.logger.error("Failed to open draft: %s", draft.local_path)
+            self.show_message("无法打开草稿箱", "error")
             
     def open_draft_by_uuid(self, uuid):
         """
@@ -32,6 +32,10 @@ class MainWindow(MSFluentWindow):
         self.logger = logging.getLogger(__name__)
         self.settings = QSettings("JianYingPro", "DraftTools")
         
+        # Snapshot settings read on every close/state save
+        self.auto_save_window_state = get_bool_setting('AUTO_SAVE_WINDOW_STATE', True)
+        self.confirm_exit = get_bool_setting('CONFIRM_EXIT', True)
+        
         # Initialize UI components
         self.message_handler = MessageHandler(self)
         self.setup_ui()
@@ -148,14 +152,14 @@ class MainWindow(MSFluentWindow):
                 
     def save_window_state(self):
         """Save window state to settings"""
-        if get_bool_setting('AUTO_SAVE_WINDOW_STATE', True):
+        if self.auto_save_window_state:
             self.settings.setValue("geometry", self.saveGeometry())
             self.settings.setValue("windowState", self.saveState())
             self.settings.setValue("maximized", self.isMaximized())
             
     def load_window_state(self):
         """Load window state from settings"""
-        if get_bool_setting('AUTO_SAVE_WINDOW_STATE', True):
+        if self.auto_save_window_state:
             # Restore window geometry
             if self.settings.contains("geometry"):
                 self.restoreGeometry(self.settings.value("geometry"))
@@ -182,7 +186,7 @@ class MainWindow(MSFluentWindow):
             event (QCloseEvent): Close event
         """
         # Check if confirmation is required
-        if get_bool_setting('CONFIRM_EXIT', True):
+        if self.confirm_exit:
             # 使用Fluent风格的对话框
             if MessageBox(
                 "确认退出",
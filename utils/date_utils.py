@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from datetime import datetime
+
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO 8601 date string
+    
+    Python 3.11+ accepts a trailing 'Z' directly, so the string is only
+    rewritten to '+00:00' when the first parse attempt fails.
+    
+    Args:
+        value (str): ISO 8601 date string
+        
+    Returns:
+        datetime: Parsed datetime
+        
+    Raises:
+        ValueError: If the string is not a valid ISO 8601 date
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        if value.endswith('Z'):
+            return datetime.fromisoformat(value[:-1] + '+00:00')
+        raise